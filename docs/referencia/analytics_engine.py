@@ -6,7 +6,7 @@ import json
 import os
 import time
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
 from dataclasses import dataclass, asdict
@@ -34,6 +34,10 @@ class AnalyticsEngine:
         # Dados
         self.data = self._load_data()
 
+        # Melhores horários calculados: dependem só do dia e da atividade,
+        # então ficam em cache até virar o dia ou a atividade ser refeita
+        self._best_times_cache: Optional[Tuple[date, List[Tuple[int, int, str]]]] = None
+
     def _load_data(self) -> Dict:
         try:
             from utils import load_json
@@ -73,6 +77,7 @@ class AnalyticsEngine:
         # Estimativa baseada em dados gerais
         activity = self._estimate_activity()
         self.data["follower_activity"] = activity
+        self._best_times_cache = None
         self.save_data()
         print_success("Análise de atividade concluída (estimativa)!")
         return activity
@@ -93,6 +98,10 @@ class AnalyticsEngine:
     # ============================================
 
     def calculate_best_posting_times(self) -> List[Tuple[int, int, str]]:
+        cache_key = datetime.now().date()
+        if self._best_times_cache and self._best_times_cache[0] == cache_key:
+            return list(self._best_times_cache[1])
+
         activity = self.data.get("follower_activity") or self._estimate_activity()
 
         day_multipliers = {
@@ -131,7 +140,8 @@ class AnalyticsEngine:
         }
         self.save_data()
 
-        return scores
+        self._best_times_cache = (cache_key, scores)
+        return list(scores)
 
     def get_optimal_schedule(self, posts_per_day: int = 2) -> List[datetime]:
         best_times = self.calculate_best_posting_times()
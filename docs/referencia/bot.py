@@ -204,7 +204,7 @@ class InstagramBot:
         result = self.cl.clip_upload(video_path, caption)
         return result is not None
 
-    def schedule_week_content(self, content_folder: str = None):
+    def schedule_week_content(self, content_folder: str = None, posts_per_day: int = None):
         """Agenda conteúdo para a semana"""
         if not self.is_logged_in:
             self.login()
@@ -214,7 +214,7 @@ class InstagramBot:
 
         self.content_scheduler.auto_schedule_week(
             content_folder=content_folder,
-            posts_per_day=config.POSTS_PER_DAY,
+            posts_per_day=posts_per_day or config.POSTS_PER_DAY,
             optimal_hours=hours
         )
 
@@ -249,6 +249,8 @@ class InstagramBot:
 
     def quit(self):
         """Encerra o bot"""
+        if self._content_scheduler is not None:
+            self._content_scheduler.stop_daemon(timeout=5)
         if self.is_logged_in:
             try:
                 self.cl.save_session(config.SESSION_FILE)
@@ -10,11 +10,14 @@ import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
-from pathlib import Path
+from contextlib import contextmanager
 
 from utils import HumanBehavior, logger, safe_execute, print_success, print_info, print_error
 from config import config
 
+IMAGE_EXTS = ('.jpg', '.jpeg', '.png')
+VIDEO_EXTS = ('.mp4', '.mov', '.avi', '.mkv')
+
 
 @dataclass
 class ScheduledPost:
@@ -55,6 +58,14 @@ class ContentScheduler:
         self.posts_queue: List[ScheduledPost] = []
         self.templates: Dict = {}
         self._stop_event = threading.Event()
+        self._daemon_thread: Optional[threading.Thread] = None
+
+        # Gravações adiadas dentro de batch()
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+        # Índice de mídia por pasta: {pasta: (mtime_ns da pasta, índice)}
+        self._media_indexes: Dict[str, tuple] = {}
 
         self.load_data()
         self.load_templates()
@@ -70,12 +81,27 @@ class ContentScheduler:
             self.posts_queue = []
 
     def save_data(self):
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
         try:
             from utils import save_json
             save_json([p.to_dict() for p in self.posts_queue], self.schedule_file)
         except Exception as e:
             logger.error(f"Erro ao salvar agenda: {e}")
 
+    @contextmanager
+    def batch(self):
+        """Adia save_data até o fim do bloco: uma única gravação para vários agendamentos"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.save_data()
+
     def load_templates(self):
         default = {
             "motivational": [
@@ -227,7 +253,7 @@ class ContentScheduler:
 
         ext = os.path.splitext(media_path)[1].lower()
 
-        if ext in ['.mp4', '.mov', '.avi', '.mkv']:
+        if ext in VIDEO_EXTS:
             result = self.cl.video_upload(media_path, caption=full_caption)
         else:
             result = self.cl.photo_upload(media_path, caption=full_caption)
@@ -247,7 +273,7 @@ class ContentScheduler:
 
         ext = os.path.splitext(media_path)[1].lower()
 
-        if ext in ['.mp4', '.mov', '.avi', '.mkv']:
+        if ext in VIDEO_EXTS:
             result = self.cl.video_upload_to_story(
                 media_path, caption=post.caption[:50] if post.caption else ""
             )
@@ -270,7 +296,7 @@ class ContentScheduler:
             raise FileNotFoundError(f"Arquivo não encontrado: {media_path}")
 
         ext = os.path.splitext(media_path)[1].lower()
-        if ext not in ['.mp4', '.mov', '.avi', '.mkv']:
+        if ext not in VIDEO_EXTS:
             logger.error("Reels requerem arquivo de vídeo (.mp4, .mov, .avi)")
             return False
 
@@ -285,6 +311,54 @@ class ContentScheduler:
             return True
         return False
 
+    # ============================================
+    # ÍNDICE DE MÍDIA
+    # ============================================
+
+    def media_index(self, folder: str = None) -> Dict[str, dict]:
+        """
+        {nome: {path, mtime, size, type}} das mídias de `folder` (padrão
+        CONTENT_FOLDER). Só é refeito quando o mtime da pasta muda, isto é,
+        quando arquivos entram, saem ou são renomeados.
+        """
+        folder = folder or config.CONTENT_FOLDER
+        try:
+            folder_mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            return {}
+
+        cached = self._media_indexes.get(folder)
+        if cached and cached[0] == folder_mtime:
+            return cached[1]
+
+        index = {}
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in IMAGE_EXTS:
+                    kind = "image"
+                elif ext in VIDEO_EXTS:
+                    kind = "video"
+                else:
+                    continue
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                index[entry.name] = {
+                    "path": entry.path, "mtime": st.st_mtime,
+                    "size": st.st_size, "type": kind,
+                }
+
+        self._media_indexes[folder] = (folder_mtime, index)
+        return index
+
+    def resolve_media(self, path: str) -> Optional[str]:
+        """Caminho de mídia existente; aceita também só o nome de um arquivo de CONTENT_FOLDER"""
+        entry = self.media_index().get(path)
+        if entry:
+            return entry["path"]
+        return path if os.path.isfile(path) else None
+
     # ============================================
     # AUTO-AGENDAMENTO
     # ============================================
@@ -297,9 +371,10 @@ class ContentScheduler:
         posts_per_day = posts_per_day or config.POSTS_PER_DAY
         optimal_hours = optimal_hours or config.DEFAULT_POST_HOURS
 
-        image_files = []
-        for ext in ['*.jpg', '*.jpeg', '*.png']:
-            image_files.extend(list(Path(content_folder).glob(ext)))
+        image_files = [
+            entry["path"] for _, entry in sorted(self.media_index(content_folder).items())
+            if entry["type"] == "image"
+        ]
 
         if not image_files:
             print_error(f"Nenhuma imagem encontrada em {content_folder}")
@@ -311,41 +386,42 @@ class ContentScheduler:
         scheduled = 0
         image_idx = 0
 
-        for day_offset in range(7):
-            for post_num in range(posts_per_day):
-                if image_idx >= len(image_files):
-                    break
-
-                hour = optimal_hours[post_num % len(optimal_hours)]
-                post_time = now + timedelta(days=day_offset)
-                post_time = post_time.replace(
-                    hour=hour,
-                    minute=random.randint(0, 30),
-                    second=0
-                )
-
-                if post_time < now:
-                    post_time += timedelta(days=1)
-
-                image = image_files[image_idx]
-
-                topics = ["crescimento", "conteudo", "engajamento"]
-                styles = ["motivational", "educational", "engagement", "questions"]
-                caption = self.generate_caption(
-                    topic=random.choice(topics),
-                    style=random.choice(styles)
-                )
-
-                self.schedule_post(
-                    str(image),
-                    caption,
-                    config.TARGET_HASHTAGS[:8],
-                    post_time,
-                    "feed"
-                )
-
-                scheduled += 1
-                image_idx += 1
+        with self.batch():
+            for day_offset in range(7):
+                for post_num in range(posts_per_day):
+                    if image_idx >= len(image_files):
+                        break
+
+                    hour = optimal_hours[post_num % len(optimal_hours)]
+                    post_time = now + timedelta(days=day_offset)
+                    post_time = post_time.replace(
+                        hour=hour,
+                        minute=random.randint(0, 30),
+                        second=0
+                    )
+
+                    if post_time < now:
+                        post_time += timedelta(days=1)
+
+                    image = image_files[image_idx]
+
+                    topics = ["crescimento", "conteudo", "engajamento"]
+                    styles = ["motivational", "educational", "engagement", "questions"]
+                    caption = self.generate_caption(
+                        topic=random.choice(topics),
+                        style=random.choice(styles)
+                    )
+
+                    self.schedule_post(
+                        image,
+                        caption,
+                        config.TARGET_HASHTAGS[:8],
+                        post_time,
+                        "feed"
+                    )
+
+                    scheduled += 1
+                    image_idx += 1
 
         print_success(f"{scheduled} posts agendados!")
         return scheduled
@@ -371,11 +447,28 @@ class ContentScheduler:
 
         print_info("Daemon de publicação encerrado")
 
-    def stop_daemon(self):
+    def start_daemon(self, check_interval: int = 300) -> bool:
+        """Inicia o daemon em thread própria (no máximo uma por vez)"""
+        if self.is_daemon_running():
+            return False
+        self._stop_event.clear()
+        self._daemon_thread = threading.Thread(
+            target=self.run_scheduler_daemon,
+            args=(check_interval,),
+            daemon=True
+        )
+        self._daemon_thread.start()
+        return True
+
+    def stop_daemon(self, timeout: float = None) -> bool:
+        """Sinaliza parada; com `timeout`, espera a thread sair. Retorna True se parou"""
         self._stop_event.set()
+        if timeout is not None and self._daemon_thread is not None:
+            self._daemon_thread.join(timeout)
+        return not self.is_daemon_running()
 
     def is_daemon_running(self) -> bool:
-        return not self._stop_event.is_set()
+        return self._daemon_thread is not None and self._daemon_thread.is_alive()
 
 # Importações
 from utils import load_json, save_json, print_success, print_info, print_error
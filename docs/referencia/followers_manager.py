@@ -7,7 +7,7 @@ import os
 import time
 import random
 from datetime import datetime, timedelta
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, AbstractSet
 from dataclasses import dataclass, asdict
 from collections import defaultdict
 
@@ -31,6 +31,13 @@ class UserProfile:
     def to_dict(self):
         return asdict(self)
 
+    def reset(self, username: str, user_id: str = "", followed_at: Optional[str] = None,
+              source: str = "", **fields) -> "UserProfile":
+        """Reinicializa o perfil in-place (re-follow) em vez de alocar outro"""
+        self.__init__(username=username, user_id=user_id, followed_at=followed_at,
+                      source=source, **fields)
+        return self
+
     @property
     def days_since_followed(self) -> int:
         if not self.followed_at:
@@ -54,6 +61,7 @@ class FollowersManager:
         # Dados em memória
         self.followed_users: Dict[str, UserProfile] = {}
         self.whitelist: Set[str] = set()
+        self._whitelist_sorted: Optional[List[str]] = None
         self.daily_stats = defaultdict(int)
 
         self.load_data()
@@ -73,13 +81,19 @@ class FollowersManager:
         except Exception as e:
             logger.error(f"Erro ao carregar whitelist: {e}")
             self.whitelist = set()
+        self._whitelist_sorted = None
 
         self.daily_stats = defaultdict(int, load_json(self.stats_file, {}))
 
+    @property
+    def followed_usernames(self) -> AbstractSet[str]:
+        """Usernames já seguidos alguma vez (inclui unfollows). View O(1), sempre em sincronia."""
+        return self.followed_users.keys()
+
     def save_data(self):
         try:
             save_json({k: v.to_dict() for k, v in self.followed_users.items()}, self.data_file)
-            save_json(list(self.whitelist), self.whitelist_file)
+            save_json(self.sorted_whitelist(), self.whitelist_file)
             save_json(dict(self.daily_stats), self.stats_file)
         except Exception as e:
             logger.error(f"Erro ao salvar dados: {e}")
@@ -88,18 +102,34 @@ class FollowersManager:
     # WHITELIST
     # ============================================
 
+    def _save_whitelist(self):
+        # Só o arquivo da whitelist; followers_data pode ser grande
+        self._whitelist_sorted = None
+        try:
+            save_json(self.sorted_whitelist(), self.whitelist_file)
+        except Exception as e:
+            logger.error(f"Erro ao salvar whitelist: {e}")
+
     def add_to_whitelist(self, username: str):
         username = username.lower().strip()
-        self.whitelist.add(username)
-        self.save_data()
+        if username not in self.whitelist:
+            self.whitelist.add(username)
+            self._save_whitelist()
         logger.info(f"🛡️  @{username} adicionado à whitelist")
 
     def remove_from_whitelist(self, username: str):
         username = username.lower().strip()
-        self.whitelist.discard(username)
-        self.save_data()
+        if username in self.whitelist:
+            self.whitelist.discard(username)
+            self._save_whitelist()
         logger.info(f"🗑️  @{username} removido da whitelist")
 
+    def sorted_whitelist(self) -> List[str]:
+        """Whitelist ordenada (cacheada até a próxima alteração)"""
+        if self._whitelist_sorted is None:
+            self._whitelist_sorted = sorted(self.whitelist)
+        return self._whitelist_sorted
+
     def is_whitelisted(self, username: str) -> bool:
         return username.lower().strip() in self.whitelist
 
@@ -154,6 +184,18 @@ class FollowersManager:
     # AÇÕES
     # ============================================
 
+    def record_follow(self, username: str, user_id: str, source: str = "", **fields) -> UserProfile:
+        """Registra um follow, reaproveitando o perfil se já existir no histórico"""
+        followed_at = datetime.now().isoformat()
+        profile = self.followed_users.get(username)
+        if profile is None:
+            profile = UserProfile(username=username, user_id=user_id,
+                                  followed_at=followed_at, source=source, **fields)
+            self.followed_users[username] = profile
+        else:
+            profile.reset(username, user_id, followed_at, source, **fields)
+        return profile
+
     @safe_execute(max_retries=2)
     def follow_user(self, username: str, source: str = "") -> bool:
         """Segue um usuário específico"""
@@ -175,15 +217,14 @@ class FollowersManager:
                 logger.warning(f"Falha ao seguir @{username}")
                 return False
 
-            self.followed_users[username] = UserProfile(
-                username=username,
-                user_id=str(user_id),
+            self.record_follow(
+                username,
+                str(user_id),
+                source,
                 followers_count=user_info.follower_count or 0,
                 following_count=user_info.following_count or 0,
                 is_private=user_info.is_private,
                 is_verified=user_info.is_verified,
-                followed_at=datetime.now().isoformat(),
-                source=source,
             )
 
             self.rate_limiter.record_action('follows')
@@ -262,7 +303,7 @@ class FollowersManager:
             if followed_count >= max_follows:
                 break
 
-            if username in self.followed_users:
+            if username in self.followed_usernames:
                 continue
 
             try:
@@ -4,16 +4,52 @@ Usa instagrapi (API privada) — sem Selenium
 """
 import json
 import os
+import re
 import time
 import random
+import atexit
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Optional
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from typing import List, Dict, Set, Optional, Callable, Iterator, Tuple, Any
+from dataclasses import dataclass
 
-from utils import HumanBehavior, RateLimiter, logger, safe_execute, print_success, print_info
+from utils import (
+    HumanBehavior, RateLimiter, logger, safe_execute,
+    print_success, print_info, load_json, save_json, ensure_dir
+)
 from config import config
 
+# Shortcode de URLs de post/reel/IGTV
+_SHORTCODE_RE = re.compile(r'instagram\.com/(?:p|reel|tv)/([A-Za-z0-9_-]+)')
+
+# Relatórios (templates montados uma vez; preenchidos com format_map)
+_SESSION_HEADER_TMPL = """
+╔══════════════════════════════════════════════════════════╗
+║  🚀 SESSÃO DE CRESCIMENTO: {session:12}               ║
+╠══════════════════════════════════════════════════════════╣
+║  Follows: {follows:3}  |  Unfollows: {unfollows:3}                    ║
+║  Likes:   {likes:3}  |  Comments:   {comments:3}                    ║
+║  Stories: {stories:3}                                          ║
+╚══════════════════════════════════════════════════════════╝
+        """
+
+_REPORT_TMPL = """
+╔══════════════════════════════════════════════════════════╗
+║           📊 RELATÓRIO DA SESSÃO                         ║
+╠══════════════════════════════════════════════════════════╣
+║  📅 Data: {dia}                                    ║
+║  ➕ Follows:      {follows_realizados:4}                          ║
+║  ➖ Unfollows:    {unfollows_realizados:4}                          ║
+║  ❤️  Curtidas:     {curtidas_enviadas:4}                          ║
+║  💬 Comentários:  {comentarios_enviados:4}                          ║
+║  👀 Stories:      {stories_visualizados:4}                          ║
+╠══════════════════════════════════════════════════════════╣
+║  📈 Projeção: ~{projecao:.0f} novos seguidores (30% conv.)  ║
+╚══════════════════════════════════════════════════════════╝
+        """
+
 @dataclass
 class GrowthStats:
     """Estatísticas de crescimento diário"""
@@ -25,13 +61,38 @@ class GrowthStats:
     stories_visualizados: int = 0
     posts_curtidos: int = 0
 
+    INT_FIELDS = (
+        'follows_realizados', 'unfollows_realizados', 'curtidas_enviadas',
+        'comentarios_enviados', 'stories_visualizados', 'posts_curtidos',
+    )
+
     def to_dict(self):
-        return asdict(self)
+        # Campos planos: cópia rasa basta (asdict faz deepcopy recursivo)
+        return dict(vars(self))
 
 
 class GrowthEngine:
     """Motor completo de crescimento orgânico via instagrapi"""
 
+    # Máximo de story IDs marcados como vistos por request
+    STORY_SEEN_BATCH = 50
+
+    # Leituras de stories simultâneas (tamanho máximo de cada lote)
+    READ_WORKERS = 4
+
+    # Máximo de páginas de curtidores percorridas por post
+    MAX_LIKER_PAGES = 5
+
+    # Backoff em rate limit (segundos): começa em BACKOFF_START, dobra até
+    # BACKOFF_MAX e zera após BACKOFF_RESET_AFTER sucessos seguidos
+    BACKOFF_START = 60.0
+    BACKOFF_MAX = 600.0
+    BACKOFF_JITTER = 30.0
+    BACKOFF_RESET_AFTER = 5
+
+    # Intervalo (s) entre gravações do log de eventos
+    STATS_FLUSH_INTERVAL = 5.0
+
     def __init__(self, cl, rate_limiter, followers_manager):
         self.cl = cl
         self.rate_limiter = rate_limiter
@@ -39,31 +100,138 @@ class GrowthEngine:
 
         # Arquivos
         self.stats_file = os.path.join(config.DATA_DIR, "growth_stats.json")
+        self.events_file = os.path.join(config.DATA_DIR, "growth_events.ndjson")
         self.targets_file = os.path.join(config.DATA_DIR, "growth_targets.json")
+        self.targets_log_file = os.path.join(config.DATA_DIR, "growth_targets.ndjson")
 
         # Dados
         self.daily_stats: Dict[str, GrowthStats] = {}
         self.targets = self._load_targets()
+        self._influencer_set: Set[str] = {
+            t.get("username") for t in self.targets["influenciadores"]
+        }
+        self._competitor_set: Set[str] = {
+            c if isinstance(c, str) else c.get("username")
+            for c in self.targets["concorrentes"]
+        }
+
+        # Log de eventos (append-only), compactado em stats_file uma vez por dia.
+        # Eventos ficam em buffer e são gravados juntos pelo flusher em background.
+        self._events_fp = None
+        self._log_day = ""
+        self._pending_events: List[str] = []
+        self._event_seq = 0  # último evento numerado; o snapshot guarda até onde já aplicou
+        self._events_lock = threading.Lock()
+        self._flush_wake = threading.Event()
+
+        # Estado de backoff por endpoint ('follows', 'likes', ...)
+        self._backoff: Dict[str, float] = {}
+        self._backoff_streak: Dict[str, int] = {}
+
+        # Cache do post mais recente por perfil (invalidado a cada hora)
+        self._recent_post_cached = functools.lru_cache(maxsize=256)(self._fetch_recent_post)
 
         self._load_stats()
 
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+        atexit.register(self._flush_events)
+
     def _load_stats(self):
+        applied = 0
         try:
-            from utils import load_json
             data = load_json(self.stats_file, {})
+            applied = data.pop("_seq", 0)
             self.daily_stats = {k: GrowthStats(**v) for k, v in data.items()}
         except:
             self.daily_stats = {}
+            applied = 0
+        self._event_seq = applied
+        self._log_day = self._replay_events(applied)
+
+    def _replay_events(self, applied: int = 0) -> str:
+        """Aplica o log NDJSON sobre o snapshot. Retorna o dia mais antigo do log.
+        Eventos com seq <= applied já estão no snapshot (crash entre gravar o
+        snapshot e zerar o log) e são ignorados."""
+        oldest = datetime.now().strftime("%Y-%m-%d")
+        try:
+            with open(self.events_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                        seq = event.get("seq")
+                        if seq is not None:
+                            self._event_seq = max(self._event_seq, seq)
+                            if seq <= applied:
+                                continue
+                        stats = self._get_stats(event["day"])
+                        field = event["field"]
+                        setattr(stats, field, getattr(stats, field) + event["n"])
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        continue  # linha truncada/inválida
+                    oldest = min(oldest, event["day"])
+        except FileNotFoundError:
+            pass
+        return oldest
+
+    def _increment(self, field: str, n: int = 1):
+        """Incrementa um contador do dia e registra o evento no log"""
+        stats = self._get_today_stats()
+        # Registrar antes de aplicar: uma eventual compactação não pode incluir este evento
+        self._append_event(stats.dia, field, n)
+        setattr(stats, field, getattr(stats, field) + n)
+
+    def _append_event(self, day: str, field: str, n: int):
+        if day != self._log_day:
+            self._compact_stats()
+            self._log_day = day
+        with self._events_lock:
+            self._event_seq += 1
+            line = json.dumps({"seq": self._event_seq, "t": time.time(),
+                               "day": day, "field": field, "n": n}) + "\n"
+            self._pending_events.append(line)
+
+    def _flush_loop(self):
+        while True:
+            self._flush_wake.wait(self.STATS_FLUSH_INTERVAL)
+            self._flush_wake.clear()
+            try:
+                self._flush_events()
+            except Exception as e:
+                logger.error(f"Erro ao gravar log de estatísticas: {e}")
+
+    def _flush_events(self):
+        """Grava de uma vez os eventos acumulados desde o último flush"""
+        with self._events_lock:
+            if not self._pending_events:
+                return
+            if self._events_fp is None:
+                ensure_dir(os.path.dirname(self.events_file))
+                self._events_fp = open(self.events_file, 'a', encoding='utf-8')
+            self._events_fp.write("".join(self._pending_events))
+            self._events_fp.flush()
+            self._pending_events.clear()
+
+    def _compact_stats(self):
+        """Reescreve o snapshot completo e zera o log de eventos.
+        O snapshot guarda o seq do último evento aplicado: se o processo cair
+        antes de zerar o log, o replay pula o que já foi contado."""
+        with self._events_lock:
+            # Eventos pendentes já estão aplicados em daily_stats e entram no snapshot
+            self._pending_events.clear()
+            if self._events_fp is not None:
+                self._events_fp.close()
+                self._events_fp = None
+            snapshot = {k: v.to_dict() for k, v in self.daily_stats.items()}
+            snapshot["_seq"] = self._event_seq
+            save_json(snapshot, self.stats_file)
+            open(self.events_file, 'w').close()
 
     def _save_stats(self):
-        from utils import save_json
-        save_json(
-            {k: v.to_dict() for k, v in self.daily_stats.items()},
-            self.stats_file
-        )
+        """Acorda o flusher para gravar já os eventos pendentes (fim de estratégia),
+        sem esperar o próximo STATS_FLUSH_INTERVAL"""
+        self._flush_wake.set()
 
     def _load_targets(self) -> Dict:
-        from utils import load_json
         default = {
             "influenciadores": [],
             "concorrentes": [],
@@ -78,28 +246,126 @@ class GrowthEngine:
                 "Muito útil, obrigado! 🙏"
             ]
         }
-        return load_json(self.targets_file, default)
+        targets = load_json(self.targets_file, default)
 
-    def save_targets(self):
-        from utils import save_json
-        save_json(self.targets, self.targets_file)
+        # Adições registradas no log desde a última compactação
+        replayed = 0
+        try:
+            with open(self.targets_log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        items = targets[entry["list"]]
+                        item = entry["item"]
+                    except (ValueError, KeyError, TypeError):
+                        continue  # linha truncada/inválida
+                    if item not in items:
+                        items.append(item)
+                    replayed += 1
+        except FileNotFoundError:
+            pass
+
+        if replayed:
+            self.save_targets(targets)
+        return targets
+
+    def save_targets(self, targets: Dict = None):
+        """Reescreve o snapshot completo e zera o log de adições"""
+        save_json(self.targets if targets is None else targets, self.targets_file)
+        if os.path.exists(self.targets_log_file):
+            open(self.targets_log_file, 'w').close()
+
+    def _append_target(self, list_name: str, item):
+        """Registra uma adição com uma única linha no log (sem reescrever o snapshot)"""
+        ensure_dir(os.path.dirname(self.targets_log_file))
+        with open(self.targets_log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"list": list_name, "item": item}, ensure_ascii=False) + "\n")
 
     def add_target_influencer(self, username: str, niche: str = ""):
         username = username.strip().lower()
-        if username not in [t.get("username") for t in self.targets["influenciadores"]]:
-            self.targets["influenciadores"].append({
-                "username": username,
-                "niche": niche,
-                "added_at": datetime.now().isoformat()
-            })
-            self.save_targets()
-            print_success(f"Influenciador @{username} adicionado")
+        if username in self._influencer_set:
+            return
+        entry = {
+            "username": username,
+            "niche": niche,
+            "added_at": datetime.now().isoformat()
+        }
+        self.targets["influenciadores"].append(entry)
+        self._influencer_set.add(username)
+        self._append_target("influenciadores", entry)
+        print_success(f"Influenciador @{username} adicionado")
+
+    def add_target_competitor(self, username: str):
+        username = username.strip().lower().lstrip('@')
+        if not username or username in self._competitor_set:
+            return
+        self.targets["concorrentes"].append(username)
+        self._competitor_set.add(username)
+        self._append_target("concorrentes", username)
+        print_success(f"Concorrente @{username} adicionado")
+
+    def _get_stats(self, day: str) -> GrowthStats:
+        if day not in self.daily_stats:
+            self.daily_stats[day] = GrowthStats(dia=day)
+        return self.daily_stats[day]
 
     def _get_today_stats(self) -> GrowthStats:
-        today = datetime.now().strftime("%Y-%m-%d")
-        if today not in self.daily_stats:
-            self.daily_stats[today] = GrowthStats(dia=today)
-        return self.daily_stats[today]
+        return self._get_stats(datetime.now().strftime("%Y-%m-%d"))
+
+    # ============================================
+    # RATE LIMIT / BACKOFF
+    # ============================================
+
+    @staticmethod
+    def _is_rate_limit(e: Exception) -> bool:
+        return 'wait' in str(e).lower() or '429' in str(e)
+
+    def _backoff_wait(self, endpoint: str):
+        """Pausa exponencial com jitter, independente por endpoint"""
+        prev = self._backoff.get(endpoint, 0.0)
+        base = min(prev * 2, self.BACKOFF_MAX) if prev else self.BACKOFF_START
+        self._backoff[endpoint] = base
+        self._backoff_streak[endpoint] = 0
+
+        wait = base + random.uniform(0, self.BACKOFF_JITTER)
+        logger.warning(f"⏳ Rate limit em '{endpoint}'. Pausando {wait:.0f}s...")
+        time.sleep(wait)
+
+    def _backoff_success(self, endpoint: str):
+        if not self._backoff.get(endpoint):
+            return
+        streak = self._backoff_streak.get(endpoint, 0) + 1
+        if streak >= self.BACKOFF_RESET_AFTER:
+            self._backoff[endpoint] = 0.0
+            streak = 0
+        self._backoff_streak[endpoint] = streak
+
+    @staticmethod
+    def _prefetched_pages(fetch_page: Callable[[str], Tuple[List[Any], str]],
+                          max_pages: int, prefetch_margin: int = 5) -> Iterator[Any]:
+        """
+        Itera itens de uma listagem paginada buscando a próxima página em
+        background enquanto o fim da atual é consumido (a latência fica
+        escondida atrás dos delays entre ações). A busca só é disparada perto
+        do fim da página para não gastar requests se o consumidor parar antes.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(fetch_page, "")
+            for page in range(max_pages):
+                items, cursor = future.result()
+                future = None
+                has_next = bool(cursor) and page + 1 < max_pages
+                prefetch_at = max(len(items) - prefetch_margin, 0)
+
+                for i, item in enumerate(items):
+                    if has_next and future is None and i >= prefetch_at:
+                        future = pool.submit(fetch_page, cursor)
+                    yield item
+
+                if not has_next:
+                    return
+                if future is None:
+                    future = pool.submit(fetch_page, cursor)
 
     # ============================================
     # ESTRATÉGIA 1: FOLLOW EM CURTIDORES
@@ -113,57 +379,58 @@ class GrowthEngine:
         """
         print_info(f"Processando curtidores: {post_url[:60]}...")
 
-        try:
-            # Extrair shortcode da URL
-            import re
-            match = re.search(r'instagram\.com/(?:p|reel|tv)/([A-Za-z0-9_-]+)', post_url)
-            if not match:
-                logger.error(f"URL inválida: {post_url}")
-                return 0
-            shortcode = match.group(1)
-            likers = self.cl.media_likers(shortcode)
-        except Exception as e:
-            logger.error(f"Erro ao obter curtidores: {e}")
+        if not self.rate_limiter.remaining('follows', config.MAX_FOLLOWS_PER_HOUR):
+            logger.warning("⛔ Sem orçamento de follows nesta hora")
             return 0
 
+        # Extrair shortcode da URL
+        match = _SHORTCODE_RE.search(post_url)
+        if not match:
+            logger.error(f"URL inválida: {post_url}")
+            return 0
+        shortcode = match.group(1)
+
         followed = 0
+        likers = self._prefetched_pages(
+            lambda cursor: self.cl.media_likers_page(shortcode, after=cursor),
+            self.MAX_LIKER_PAGES,
+        )
 
-        for user in likers:
-            if followed >= max_follows:
-                break
+        # Páginas de curtidores são buscadas durante a iteração: uma falha aqui
+        # encerra o laço, mas os follows já feitos ainda são salvos abaixo
+        try:
+            for user in likers:
+                if followed >= max_follows:
+                    break
 
-            username = user.username
-            if username in self.fm.followed_users:
-                continue
+                username = user.username
+                if username in self.fm.followed_usernames:
+                    continue
 
-            if not self.rate_limiter.can_perform('follows', config.MAX_FOLLOWS_PER_HOUR):
-                break
+                if not self.rate_limiter.can_perform('follows', config.MAX_FOLLOWS_PER_HOUR):
+                    break
 
-            try:
-                self.cl.user_follow(user.pk)
+                try:
+                    self.cl.user_follow(user.pk)
 
-                from followers_manager import UserProfile
-                self.fm.followed_users[username] = UserProfile(
-                    username=username,
-                    user_id=str(user.pk),
-                    followed_at=datetime.now().isoformat(),
-                    source='recent_liker'
-                )
+                    self.fm.record_follow(username, str(user.pk), source='recent_liker')
 
-                self.rate_limiter.record_action('follows')
-                self._get_today_stats().follows_realizados += 1
-                followed += 1
+                    self.rate_limiter.record_action('follows')
+                    self._increment('follows_realizados')
+                    self._backoff_success('follows')
+                    followed += 1
 
-                logger.info(f"✅ Seguiu curtidor {followed}/{max_follows}: @{username}")
-                HumanBehavior.random_delay(8, 15)
+                    logger.info(f"✅ Seguiu curtidor {followed}/{max_follows}: @{username}")
+                    HumanBehavior.random_delay(8, 15)
 
-            except Exception as e:
-                if 'wait' in str(e).lower() or '429' in str(e):
-                    logger.warning("⏳ Rate limit. Pausando 5 min...")
-                    time.sleep(300)
-                    break
-                logger.warning(f"Erro ao seguir @{username}: {e}")
-                continue
+                except Exception as e:
+                    if self._is_rate_limit(e):
+                        self._backoff_wait('follows')
+                        break
+                    logger.warning(f"Erro ao seguir @{username}: {e}")
+                    continue
+        except Exception as e:
+            logger.error(f"Erro ao obter curtidores: {e}")
 
         self._save_stats()
         self.fm.save_data()
@@ -183,50 +450,87 @@ class GrowthEngine:
         print_info(f"Visualizando stories de {len(hashtags)} hashtags...")
 
         viewed = 0
+        queued = 0
+        pending_ids: List[str] = []
         users_processed = set()
 
+        def flush_seen():
+            # Um único POST por lote de até STORY_SEEN_BATCH IDs
+            nonlocal viewed
+            if not pending_ids:
+                return
+            try:
+                if self.cl.story_seen(pending_ids):
+                    viewed += len(pending_ids)
+                    self._increment('stories_visualizados', len(pending_ids))
+                    self._backoff_success('stories')
+                    logger.info(f"👀 Marcados {len(pending_ids)} stories como vistos")
+            finally:
+                # Lote com falha não é reenviado nos próximos flushes
+                pending_ids.clear()
+
+        def fetch_stories(user_id):
+            try:
+                return self.cl.user_stories(user_id)
+            except Exception as e:
+                if self._is_rate_limit(e):
+                    raise
+                logger.warning(f"Erro ao ver stories: {e}")
+                return []
+
         for hashtag in hashtags[:3]:
-            if viewed >= max_stories:
+            if queued >= max_stories:
                 break
 
             try:
                 # Busca posts top da hashtag e descobre usuários
                 medias = self.cl.hashtag_medias_top(hashtag, amount=20)
 
+                user_ids = []
                 for media in medias:
-                    if viewed >= max_stories:
-                        break
-
                     user_id = media.user.pk
-                    if user_id in users_processed:
-                        continue
-                    users_processed.add(user_id)
+                    if user_id not in users_processed:
+                        users_processed.add(user_id)
+                        user_ids.append(user_id)
 
-                    try:
-                        stories = self.cl.user_stories(user_id)
-                        if stories:
-                            # stories retorna list[dict], extrair IDs
-                            story_ids = []
-                            for s in stories[:5]:
-                                sid = s.get('id') or s.get('pk') or str(s) if isinstance(s, dict) else str(s)
-                                story_ids.append(str(sid))
-
-                            if story_ids:
-                                self.cl.story_seen(story_ids)
-
-                                viewed += len(story_ids)
-                                self._get_today_stats().stories_visualizados += len(story_ids)
-
-                                logger.info(f"👀 Visto {len(story_ids)} stories de usuario {user_id}")
-                                HumanBehavior.random_delay(2, 4)
-
-                    except Exception as e:
-                        if 'wait' in str(e).lower() or '429' in str(e):
-                            logger.warning("⏳ Rate limit. Pausando 5 min...")
-                            time.sleep(300)
-                            break
-                        logger.warning(f"Erro ao ver stories: {e}")
-                        continue
+                # Só as leituras de stories vão em paralelo, em lotes de até
+                # READ_WORKERS (nunca mais usuários do que stories restantes);
+                # o delay fica entre lotes e o "visto" segue em lote
+                try:
+                    with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as pool:
+                        start = 0
+                        while start < len(user_ids) and queued < max_stories:
+                            size = min(self.READ_WORKERS, max_stories - queued)
+                            batch = user_ids[start:start + size]
+                            start += size
+
+                            for user_id, stories in zip(batch, pool.map(fetch_stories, batch)):
+                                if not stories:
+                                    continue
+                                self._backoff_success('stories')
+
+                                # stories retorna list[dict], extrair IDs
+                                story_ids = []
+                                for s in stories[:min(5, max_stories - queued)]:
+                                    sid = s.get('id') or s.get('pk') or str(s) if isinstance(s, dict) else str(s)
+                                    story_ids.append(str(sid))
+
+                                if story_ids:
+                                    pending_ids.extend(story_ids)
+                                    queued += len(story_ids)
+
+                                    logger.info(f"👀 {len(story_ids)} stories de usuario {user_id} na fila")
+                                    if len(pending_ids) >= self.STORY_SEEN_BATCH:
+                                        flush_seen()
+
+                            HumanBehavior.random_delay(2, 4)
+
+                except Exception as e:
+                    if not self._is_rate_limit(e):
+                        raise
+                    self._backoff_wait('stories')
+
+                flush_seen()
 
             except Exception as e:
                 logger.warning(f"Erro na hashtag #{hashtag}: {e}")
@@ -258,6 +562,7 @@ class GrowthEngine:
                 continue
 
             try:
+                # Um lookup por vez: um 429 aqui cai no backoff abaixo
                 media_id = self.cl.media_pk_from_url(post_url.strip())
                 if not media_id:
                     continue
@@ -266,15 +571,15 @@ class GrowthEngine:
                 self.cl.media_comment(media_id, comment_text)
 
                 commented += 1
-                self._get_today_stats().comentarios_enviados += 1
+                self._increment('comentarios_enviados')
+                self._backoff_success('comments')
 
                 logger.info(f"💬 Comentado: '{comment_text}' em {post_url[:50]}")
                 HumanBehavior.random_delay(30, 60)
 
             except Exception as e:
-                if 'wait' in str(e).lower() or '429' in str(e):
-                    logger.warning("⏳ Rate limit. Pausando 5 min...")
-                    time.sleep(300)
+                if self._is_rate_limit(e):
+                    self._backoff_wait('comments')
                     break
                 logger.error(f"Erro ao comentar: {e}")
                 continue
@@ -294,8 +599,14 @@ class GrowthEngine:
         liked = 0
         hashtag = hashtag.strip().lstrip('#')
 
+        # Não buscar mais mídias do que o orçamento de likes permite
+        budget = min(max_likes, self.rate_limiter.remaining('likes', config.MAX_LIKES_PER_HOUR))
+        if budget <= 0:
+            logger.warning("⛔ Sem orçamento de likes nesta hora")
+            return 0
+
         try:
-            medias = self.cl.hashtag_medias_top(hashtag, amount=max_likes)
+            medias = self.cl.hashtag_medias_top(hashtag, amount=budget)
 
             for media in medias:
                 if liked >= max_likes:
@@ -307,16 +618,16 @@ class GrowthEngine:
                 try:
                     self.cl.media_like(str(media.pk))
                     liked += 1
-                    self._get_today_stats().curtidas_enviadas += 1
+                    self._increment('curtidas_enviadas')
+                    self._backoff_success('likes')
                     self.rate_limiter.record_action('likes')
 
                     logger.info(f"❤️  Curtido {liked}/{max_likes}")
                     HumanBehavior.random_delay(3, 6)
 
                 except Exception as e:
-                    if 'wait' in str(e).lower() or '429' in str(e):
-                        logger.warning("⏳ Rate limit. Pausando 5 min...")
-                        time.sleep(300)
+                    if self._is_rate_limit(e):
+                        self._backoff_wait('likes')
                         break
                     continue
 
@@ -357,15 +668,7 @@ class GrowthEngine:
 
         cfg = configs.get(session_type, configs["balanced"])
 
-        print(f"""
-╔══════════════════════════════════════════════════════════╗
-║  🚀 SESSÃO DE CRESCIMENTO: {session_type.upper():12}               ║
-╠══════════════════════════════════════════════════════════╣
-║  Follows: {cfg['follows']:3}  |  Unfollows: {cfg['unfollows']:3}                    ║
-║  Likes:   {cfg['likes']:3}  |  Comments:   {cfg['comments']:3}                    ║
-║  Stories: {cfg['stories']:3}                                          ║
-╚══════════════════════════════════════════════════════════╝
-        """)
+        print(_SESSION_HEADER_TMPL.format_map({"session": session_type.upper(), **cfg}))
 
         # 1. UNFOLLOW PRIMEIRO
         print("\n📍 FASE 1: Limpando não-seguidores...")
@@ -416,51 +719,38 @@ class GrowthEngine:
         self._print_session_report()
 
     def _get_recent_post(self, username: str) -> Optional[str]:
-        """Pega URL do post mais recente de um perfil"""
+        """Pega URL do post mais recente de um perfil (cache de 1h)"""
         try:
-            user_id = self.cl.get_user_id_from_username(username)
-            if not user_id:
-                return None
-            medias = self.cl.user_medias(user_id, amount=1)
-            if medias:
-                media = medias[0]
-                return f"https://www.instagram.com/p/{media.code}/"
-            return None
+            return self._recent_post_cached(username, int(time.time() // 3600))
         except Exception as e:
             logger.warning(f"Erro ao buscar post de @{username}: {e}")
             return None
 
+    def _fetch_recent_post(self, username: str, hour_bucket: int) -> Optional[str]:
+        """Busca o post na API. `hour_bucket` só compõe a chave do cache;
+        exceções não são cacheadas."""
+        user_id = self.cl.get_user_id_from_username(username)
+        if not user_id:
+            return None
+        medias = self.cl.user_medias(user_id, amount=1)
+        if medias:
+            media = medias[0]
+            return f"https://www.instagram.com/p/{media.code}/"
+        return None
+
     def _print_session_report(self):
         stats = self._get_today_stats()
-
-        report = f"""
-╔══════════════════════════════════════════════════════════╗
-║           📊 RELATÓRIO DA SESSÃO                         ║
-╠══════════════════════════════════════════════════════════╣
-║  📅 Data: {stats.dia}                                    ║
-║  ➕ Follows:      {stats.follows_realizados:4}                          ║
-║  ➖ Unfollows:    {stats.unfollows_realizados:4}                          ║
-║  ❤️  Curtidas:     {stats.curtidas_enviadas:4}                          ║
-║  💬 Comentários:  {stats.comentarios_enviados:4}                          ║
-║  👀 Stories:      {stats.stories_visualizados:4}                          ║
-╠══════════════════════════════════════════════════════════╣
-║  📈 Projeção: ~{stats.follows_realizados * 0.3:.0f} novos seguidores (30% conv.)  ║
-╚══════════════════════════════════════════════════════════╝
-        """
-        print(report)
+        print(_REPORT_TMPL.format_map({
+            **vars(stats),
+            "projecao": stats.follows_realizados * 0.3,
+        }))
 
     def get_weekly_report(self) -> dict:
-        week_ago = datetime.now() - timedelta(days=7)
-        weekly = defaultdict(int)
-
-        for date_str, stats in self.daily_stats.items():
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            if date >= week_ago:
-                for key, value in vars(stats).items():
-                    if isinstance(value, int):
-                        weekly[key] += value
-
-        return dict(weekly)
-
-# Importações
-from utils import load_json, save_json
+        # Datas ISO comparam corretamente como string; dias > cutoff equivalem
+        # a "meia-noite do dia >= agora - 7 dias"
+        cutoff = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        recent = [s for d, s in self.daily_stats.items() if d > cutoff]
+        if not recent:
+            return {}
+
+        return {f: sum(getattr(s, f) for s in recent) for f in GrowthStats.INT_FIELDS}
@@ -5,20 +5,63 @@ para evitar checkpoint/challenge de IPs de datacenter.
 
 A API mobile (instagrapi) bloqueia IPs de datacenter com
 auth_platform checkpoint. A API web aceita esses IPs normalmente.
+
+Dependências opcionais (instaladas via pip, nunca vendorizadas):
+    pip install 'httpx[http2]'   # variantes async com HTTP/2 (httpx + h2)
+    pip install aiohttp          # fallback async (HTTP/1.1)
+    pip install orjson           # (de)serialização JSON mais rápida
 """
+import asyncio
+import functools
+import gzip
 import json
 import os
 import re
+import sqlite3
 import time
 import random
 import logging
 import subprocess
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable, Iterator
 from dataclasses import dataclass, field
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Clientes async opcionais, importados só no primeiro uso (_load_async_clients):
+# o fluxo síncrono não paga a importação de aiohttp/httpx na inicialização
+aiohttp = None  # variantes async de paginação
+httpx = None  # cliente async com HTTP/2 (multiplexa numa conexão)
+_async_clients_loaded = False
+
+
+def _load_async_clients():
+    global aiohttp, httpx, _async_clients_loaded
+    if _async_clients_loaded:
+        return
+    try:
+        import aiohttp
+    except ImportError:
+        aiohttp = None
+    try:
+        import httpx
+        import h2  # noqa: F401  httpx só negocia HTTP/2 com o pacote h2
+    except ImportError:
+        httpx = None
+    _async_clients_loaded = True
+
+try:
+    import orjson  # opcional: (de)serialização JSON bem mais rápida
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +69,7 @@ logger = logging.getLogger(__name__)
 # DATA CLASSES
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class WebUser:
     """Perfil de usuário retornado pela API web"""
     pk: int = 0
@@ -41,6 +84,19 @@ class WebUser:
     profile_pic_url: str = ""
     external_url: str = ""
 
+    @classmethod
+    def from_api_dict(cls, u: dict) -> "WebUser":
+        """WebUser a partir de um item de usuário da API v1 (friendships, busca)"""
+        get = u.get
+        return cls(
+            pk=get("pk", 0),
+            username=get("username", ""),
+            full_name=get("full_name", ""),
+            is_private=get("is_private", False),
+            is_verified=get("is_verified", False),
+            profile_pic_url=get("profile_pic_url", ""),
+        )
+
 
 @dataclass
 class WebMedia:
@@ -57,6 +113,174 @@ class WebMedia:
     image_url: str = ""
 
 
+# ============================================
+# RATE LIMIT POR ENDPOINT
+# ============================================
+
+class EndpointLimiter:
+    """
+    Token bucket adaptativo por endpoint (primeiro segmento do path:
+    friendships, feed, users...; para /web/ os dois primeiros, ex.
+    web/friendships, web/likes). Libera na hora se há tokens; em 429 corta
+    a taxa pela metade e respeita Retry-After; em sucesso sobe a taxa
+    aditivamente até `max_rate` (AIMD).
+    """
+
+    def __init__(self, rate: float = 1.0, max_rate: float = 2.0,
+                 min_rate: float = 0.05, burst: float = 3.0, increase: float = 0.05):
+        self.initial_rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.increase = increase
+        self._buckets: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str) -> str:
+        parts = endpoint.strip("/").split("/", 2)
+        if parts[0] == "web" and len(parts) > 1:
+            return f"web/{parts[1]}"
+        return parts[0]
+
+    def _bucket(self, endpoint: str) -> dict:
+        key = self.key(endpoint)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = {
+                    "tokens": self.burst,
+                    "last": time.monotonic(),
+                    "rate": self.initial_rate,
+                    "blocked_until": 0.0,
+                    "lock": threading.Lock(),
+                }
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, endpoint: str):
+        """Bloqueia até haver um token disponível para o endpoint"""
+        bucket = self._bucket(endpoint)
+        while True:
+            with bucket["lock"]:
+                now = time.monotonic()
+                bucket["tokens"] = min(
+                    self.burst,
+                    bucket["tokens"] + (now - bucket["last"]) * bucket["rate"],
+                )
+                bucket["last"] = now
+
+                if now < bucket["blocked_until"]:
+                    wait = bucket["blocked_until"] - now
+                elif bucket["tokens"] >= 1:
+                    bucket["tokens"] -= 1
+                    return
+                else:
+                    wait = (1 - bucket["tokens"]) / bucket["rate"]
+            time.sleep(wait)
+
+    def penalize(self, endpoint: str, retry_after: float = 30.0):
+        bucket = self._bucket(endpoint)
+        with bucket["lock"]:
+            bucket["rate"] = max(bucket["rate"] / 2, self.min_rate)
+            bucket["tokens"] = 0.0
+            bucket["blocked_until"] = time.monotonic() + retry_after
+        logger.warning(
+            f"Rate limit em '{self.key(endpoint)}': pausa {retry_after:.0f}s, "
+            f"taxa {bucket['rate']:.2f} req/s"
+        )
+
+    def reward(self, endpoint: str):
+        bucket = self._bucket(endpoint)
+        with bucket["lock"]:
+            bucket["rate"] = min(bucket["rate"] + self.increase, self.max_rate)
+
+
+def _retry_after(r, default: float = 30.0) -> float:
+    """Segundos do header Retry-After (ignora o formato de data HTTP)"""
+    try:
+        return float(r.headers.get("Retry-After", default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Blobs JSON constantes dos uploads (serializados uma vez, no import)
+_RETRY_CONTEXT_JSON = json.dumps({
+    "num_step_auto_retry": 0, "num_reupload": 0, "num_step_manual_retry": 0
+})
+_IMAGE_COMPRESSION_JSON = json.dumps({
+    "lib_name": "moz", "lib_version": "3.1.m", "quality": "80"
+})
+_EMPTY_USERTAGS_JSON = json.dumps({"in": []})
+
+
+# Headers fixos do rupload (as partes dinâmicas são sobrepostas por upload)
+_RUPLOAD_BODY_HEADERS = MappingProxyType({
+    "Offset": "0",
+    "Content-Type": "application/octet-stream",
+})
+_VIDEO_INIT_HEADERS = MappingProxyType({
+    "Accept-Encoding": "gzip, deflate",
+    "X-Entity-Type": "video/mp4",
+})
+_VIDEO_BODY_HEADERS = MappingProxyType({
+    **_RUPLOAD_BODY_HEADERS,
+    "X-Entity-Type": "video/mp4",
+})
+
+
+# Um random.Random por thread para os nomes de upload (uploads em lote)
+_tls = threading.local()
+
+
+def _upload_name(upload_id: str) -> str:
+    """Nome da entidade no rupload: <upload_id>_0_<10 dígitos aleatórios>"""
+    rng = getattr(_tls, "rng", None)
+    if rng is None:
+        rng = _tls.rng = random.Random(time.time_ns() ^ threading.get_ident())
+    return f"{upload_id}_0_{rng.randint(1000000000, 9999999999)}"
+
+
+class _FileChunks:
+    """
+    Corpo de upload lido em blocos de CHUNK_SIZE. requests usa len() para o
+    Content-Length (o rupload exige tamanho fixo, sem chunked encoding) e
+    itera os blocos, então só um bloco fica em memória por vez.
+    Não usamos os.sendfile: o rupload é HTTPS e o TLS cifra em userspace,
+    então sendfile cairia no mesmo send() em blocos (sem zero-copy).
+    """
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, f, size: int):
+        self._f = f
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._f.seek(0)  # permite reenviar o corpo
+        while chunk := self._f.read(self.CHUNK_SIZE):
+            yield chunk
+
+
+def _parse_json(r) -> Any:
+    """Corpo JSON da resposta (orjson direto dos bytes, se instalado)"""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+def _gql_params(query_hash: str, variables: dict) -> Dict[str, str]:
+    """Params de uma query GraphQL (variables em JSON compacto)"""
+    if orjson is not None:
+        encoded = orjson.dumps(variables).decode()
+    else:
+        encoded = json.dumps(variables, separators=(",", ":"))
+    return {"query_hash": query_hash, "variables": encoded}
+
+
 # ============================================
 # WEB API CLIENT
 # ============================================
@@ -75,33 +299,132 @@ class InstagramWebAPI:
     # Instagram Web App ID (público, usado pelo site)
     IG_APP_ID = "936619743392459"
 
-    def __init__(self):
+    # Query hashes GraphQL
+    Q_USER_MEDIAS = "58b6785bea111c67129decfb136ab174"
+    Q_MEDIA_LIKERS = "d5d763b1e2acf209d62d22d184f1b5f2"
+    Q_HASHTAG_MEDIAS = "174a21c41ef669bdf70474b0a94ee3ad"
+    Q_SHORTCODE_MEDIA = "b3055c01b4b222b8a47dc12b090e4e64"
+
+    # Headers padrão (simula Chrome em Windows); somente leitura, copiados
+    # para a sessão de cada instância
+    DEFAULT_HEADERS = MappingProxyType({
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/131.0.0.0 Safari/537.36"
+        ),
+        "Accept": "*/*",
+        "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Origin": BASE_URL,
+        "Referer": f"{BASE_URL}/",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-origin",
+        "Sec-Ch-Ua": '"Chromium";v="131", "Not_A Brand";v="24"',
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": '"Windows"',
+    })
+
+    # Headers extras das chamadas AJAX (além do X-CSRFToken)
+    AJAX_HEADERS = MappingProxyType({
+        "X-Requested-With": "XMLHttpRequest",
+        "X-Instagram-AJAX": "1",
+        "X-IG-App-ID": IG_APP_ID,
+        "Content-Type": "application/x-www-form-urlencoded",
+    })
+
+    # URLs de post / reel / IGTV -> shortcode
+    _MEDIA_URL_RE = re.compile(r"instagram\.com/(?:p|reel|tv)/([A-Za-z0-9_-]+)")
+
+    # User IDs não mudam; cache username -> pk por 24h
+    USER_ID_TTL = 24 * 3600
+
+    # Perfis completos (contadores mudam): cache curto, limitado em tamanho
+    USER_INFO_TTL = 300
+    USER_INFO_MAX = 1024
+
+    # Ritmo das ações /web/ (follow, like...): até 1 a cada 5s, nunca > 1 a cada 2s
+    WRITE_LIMITS = {"rate": 0.2, "max_rate": 0.5, "min_rate": 0.01, "burst": 2.0, "increase": 0.02}
+
+    # Teto global somado de todas as ações /web/ (30/min), por cima dos
+    # buckets por endpoint; um 429 em qualquer ação desacelera todas
+    ACTIONS_PER_MINUTE = 30
+
+    # Workers dos métodos *_many: sobrepõem latência, o ritmo vem do limiter
+    BULK_WORKERS = 4
+
+    # Processos ffmpeg/ffprobe simultâneos (uploads em lote)
+    FFMPEG_SLOTS = 2
+
+    # batch_upload: tipo do item -> método de upload
+    UPLOAD_KINDS = {
+        "photo": "photo_upload",
+        "video": "video_upload",
+        "clip": "clip_upload",
+        "story_photo": "photo_upload_to_story",
+        "story_video": "video_upload_to_story",
+    }
+
+    # Conexões keep-alive por host (www, graphql, rupload...)
+    POOL_SIZE = 32
+
+    # Prompts do solver padrão (terminal) para cada tipo de desafio
+    CHALLENGE_PROMPTS = {
+        "email_code": "📱 Digite o código de verificação recebido por email: ",
+        "2fa_code": "📱 Digite o código 2FA: ",
+    }
+
+    def __init__(self, challenge_solver: Optional[Callable[[str], str]] = None):
+        """
+        challenge_solver: recebe o tipo de desafio ("email_code" ou "2fa_code")
+        e retorna o código. Padrão: pergunta no terminal via input().
+        Servidores podem injetar um solver que aguarda o código vindo da UI.
+        """
+        self.challenge_solver = challenge_solver or self._prompt_challenge
         self.session = requests.Session()
+        # Pool maior evita descartar conexões (e refazer TLS) sob uso concorrente;
+        # pool_block faz threads excedentes esperarem uma conexão livre em vez
+        # de abrir sockets avulsos. Retries ficam a cargo de _api_get/_api_post
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            pool_block=True,
+            max_retries=Retry(total=0),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Proxy vem de set_proxy(); não reler variáveis de ambiente a cada request
+        self.session.trust_env = False
         self.user_id: Optional[str] = None
         self.username: Optional[str] = None
         self.csrf_token: str = ""
         self.is_authenticated: bool = False
         self._proxy: Optional[str] = None
+        self._user_id_cache: Dict[str, Tuple[int, float]] = {}
+        self._user_info_cache: Dict[str, Tuple[WebUser, float]] = {}
+        self._user_info_inflight: Dict[str, Future] = {}
+        self._user_info_lock = threading.Lock()
+        # (path, mtime, tamanho) -> metadados do vídeo
+        self._video_info_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+        self._ffmpeg_slots = threading.Semaphore(self.FFMPEG_SLOTS)
+        self._upload_id_lock = threading.Lock()
+        self._xsharing_cache: Tuple[Optional[str], str] = (None, "[]")
+        self._media_id_cached = functools.lru_cache(maxsize=1024)(self._fetch_media_id)
+        self._last_upload_id = 0
+        self._limiter = EndpointLimiter()
+        # Ações (follow, like, comment) têm orçamento bem menor que leituras
+        self._write_limiter = EndpointLimiter(**self.WRITE_LIMITS)
+        action_rate = self.ACTIONS_PER_MINUTE / 60
+        self._action_limiter = EndpointLimiter(
+            rate=action_rate, max_rate=action_rate, min_rate=0.01, burst=2.0,
+            increase=action_rate / 10,
+        )
+        self.session.hooks["response"].append(self._track_csrf)
 
         # Headers padrão (simula Chrome em Windows)
-        self.session.headers.update({
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36"
-            ),
-            "Accept": "*/*",
-            "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Origin": self.BASE_URL,
-            "Referer": f"{self.BASE_URL}/",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Ch-Ua": '"Chromium";v="131", "Not_A Brand";v="24"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"',
-        })
+        self.session.headers.update(self.DEFAULT_HEADERS)
 
     # ============================================
     # CONFIGURAÇÃO
@@ -129,89 +452,145 @@ class InstagramWebAPI:
     # CSRF & REQUEST HELPERS
     # ============================================
 
-    def _refresh_csrf(self):
-        """Atualiza CSRF token dos cookies"""
-        # Limpar cookies csrftoken duplicados (manter apenas o último)
-        csrf_cookies = [c for c in self.session.cookies if c.name == "csrftoken"]
-        if len(csrf_cookies) > 1:
-            # Remover duplicados, manter o último
-            for c in csrf_cookies[:-1]:
-                self.session.cookies.clear(c.domain, c.path, c.name)
-
-        csrf = self.session.cookies.get("csrftoken", "")
-        if csrf:
+    def _track_csrf(self, r, *args, **kwargs):
+        """
+        Hook de resposta: mantém X-CSRFToken em dia quando o servidor rotaciona
+        o cookie, sem varrer o cookiejar da sessão a cada request. Só olha os
+        cookies desta resposta; cookies.get() levantaria CookieConflictError se
+        csrftoken vier para mais de um domínio/path.
+        """
+        csrf = None
+        for c in r.cookies:
+            if c.name == "csrftoken" and ("." + c.domain.lstrip(".")).endswith(".instagram.com"):
+                csrf = c.value
+        if csrf and csrf != self.csrf_token:
             self.csrf_token = csrf
             self.session.headers["X-CSRFToken"] = csrf
+        return r
+
+    def _refresh_csrf(self):
+        """Atualiza CSRF token dos cookies (dedup de csrftoken entre domínios/paths)"""
+        jar = self.session.cookies
+        # _cookies é {domínio: {path: {nome: Cookie}}}: busca direta por nome,
+        # sem iterar todos os cookies da sessão
+        found = [
+            cookies["csrftoken"]
+            for paths in jar._cookies.values()
+            for cookies in paths.values()
+            if "csrftoken" in cookies
+        ]
+        if not found:
+            return
+
+        keep = found[0]
+        if len(found) > 1:
+            # Manter o que o servidor mandou por último (visto por _track_csrf)
+            keep = next((c for c in found if c.value == self.csrf_token), found[-1])
+            for c in found:
+                if c is not keep:
+                    jar.clear(c.domain, c.path, c.name)
+
+        if keep.value:
+            self.csrf_token = keep.value
+            self.session.headers["X-CSRFToken"] = keep.value
+
+    @classmethod
+    def _prompt_challenge(cls, kind: str) -> str:
+        return input(cls.CHALLENGE_PROMPTS.get(kind, f"{kind}: "))
 
     def _set_ajax_headers(self):
         """Configura headers para chamadas AJAX"""
         self._refresh_csrf()
-        self.session.headers.update({
-            "X-Requested-With": "XMLHttpRequest",
-            "X-Instagram-AJAX": "1",
-            "X-IG-App-ID": self.IG_APP_ID,
-            "Content-Type": "application/x-www-form-urlencoded",
-        })
+        self.session.headers.update(self.AJAX_HEADERS)
 
     def _api_get(self, endpoint: str, params: dict = None, timeout: int = 15, retries: int = 2) -> dict:
-        """GET request para API v1 web com retry automático em 429"""
+        """GET request para API v1 web (ritmo controlado por EndpointLimiter, retry em 429)"""
         url = f"{self.API_URL}/{endpoint}"
-        self._refresh_csrf()
         for attempt in range(retries + 1):
             try:
-                self._delay(0.5, 1.5)  # delay entre requests
+                self._limiter.acquire(endpoint)
                 r = self.session.get(url, params=params, timeout=timeout)
                 r.raise_for_status()
-                return r.json()
+                self._limiter.reward(endpoint)
+                return _parse_json(r)
             except requests.exceptions.HTTPError:
                 logger.error(f"API GET {endpoint}: HTTP {r.status_code}")
-                if r.status_code == 429 and attempt < retries:
-                    wait = 30 * (attempt + 1)
-                    logger.warning(f"Rate limit (429). Aguardando {wait}s... (tentativa {attempt+1}/{retries})")
-                    time.sleep(wait)
-                    continue
+                if r.status_code == 429:
+                    self._limiter.penalize(endpoint, _retry_after(r))
+                    if attempt < retries:
+                        logger.warning(f"Rate limit (429). Nova tentativa {attempt+1}/{retries}")
+                        continue
                 raise
             except Exception as e:
                 logger.error(f"API GET {endpoint}: {e}")
                 raise
 
     def _api_post(self, endpoint: str, data: dict = None, timeout: int = 15, retries: int = 2) -> dict:
-        """POST request para API v1 web com retry automático em 429"""
+        """POST request para API v1 web (ritmo controlado por EndpointLimiter, retry em 429)"""
         url = f"{self.API_URL}/{endpoint}"
-        self._refresh_csrf()
         for attempt in range(retries + 1):
             try:
-                self._delay(0.5, 1.5)  # delay entre requests
+                self._limiter.acquire(endpoint)
                 r = self.session.post(url, data=data, timeout=timeout)
                 r.raise_for_status()
-                return r.json()
+                self._limiter.reward(endpoint)
+                return _parse_json(r)
             except requests.exceptions.HTTPError:
                 logger.error(f"API POST {endpoint}: HTTP {r.status_code}")
-                if r.status_code == 429 and attempt < retries:
-                    wait = 30 * (attempt + 1)
-                    logger.warning(f"Rate limit (429). Aguardando {wait}s... (tentativa {attempt+1}/{retries})")
-                    time.sleep(wait)
-                    continue
+                if r.status_code == 429:
+                    self._limiter.penalize(endpoint, _retry_after(r))
+                    if attempt < retries:
+                        logger.warning(f"Rate limit (429). Nova tentativa {attempt+1}/{retries}")
+                        continue
                 raise
             except Exception as e:
                 logger.error(f"API POST {endpoint}: {e}")
                 raise
 
+    def _graphql_get(self, params: dict, timeout: int = 15):
+        """GET no endpoint GraphQL (bucket 'graphql' do EndpointLimiter; 429 levanta HTTPError)"""
+        self._limiter.acquire("graphql")
+        r = self.session.get(f"{self.GRAPHQL_URL}/", params=params, timeout=timeout)
+        if r.status_code == 429:
+            self._limiter.penalize("graphql", _retry_after(r))
+            r.raise_for_status()
+        elif r.status_code == 200:
+            self._limiter.reward("graphql")
+        return r
+
     def _web_post(self, path: str, data: dict = None, timeout: int = 15) -> dict:
-        """POST request para endpoints /web/"""
+        """
+        POST request para endpoints /web/ (ritmo controlado pelos limiters de escrita).
+        Sem retry em 429: só o bucket compartilhado de ações é penalizado, uma
+        vez, pelo Retry-After; o backoff fica a cargo do chamador.
+        """
         url = f"{self.BASE_URL}{path}"
-        self._refresh_csrf()
         try:
+            self._write_limiter.acquire(path)
+            self._action_limiter.acquire("web")
             r = self.session.post(url, data=data, timeout=timeout)
             r.raise_for_status()
-            return r.json()
-        except requests.exceptions.HTTPError as e:
+            self._write_limiter.reward(path)
+            self._action_limiter.reward("web")
+            return _parse_json(r)
+        except requests.exceptions.HTTPError:
             logger.error(f"WEB POST {path}: HTTP {r.status_code}")
+            if r.status_code == 429:
+                self._action_limiter.penalize("web", _retry_after(r, 60.0))
             raise
         except Exception as e:
             logger.error(f"WEB POST {path}: {e}")
             raise
 
+    def _bulk_write(self, action: Callable[[Any], bool], targets: List[Any]) -> Dict[Any, bool]:
+        """
+        Aplica `action` a vários alvos com até BULK_WORKERS em paralelo.
+        Cada chamada passa pelos limiters de escrita, então o paralelismo só esconde
+        a latência; um 429 em qualquer worker pausa e reduz o ritmo de todos.
+        """
+        with ThreadPoolExecutor(max_workers=self.BULK_WORKERS) as pool:
+            return dict(zip(targets, pool.map(action, targets)))
+
     # ============================================
     # LOGIN / SESSÃO
     # ============================================
@@ -299,7 +678,7 @@ class InstagramWebAPI:
 
             if r.status_code == 200:
                 logger.info("Código de verificação enviado por email!")
-                code = input("📱 Digite o código de verificação recebido por email: ").strip()
+                code = self.challenge_solver("email_code").strip()
 
                 r2 = self.session.post(full_url, data={"security_code": code}, timeout=15)
                 if r2.status_code == 200 and self.session.cookies.get("sessionid"):
@@ -318,7 +697,7 @@ class InstagramWebAPI:
 
     def _handle_2fa(self, username: str, password: str, login_data: dict) -> bool:
         """Resolve autenticação de dois fatores"""
-        code = input("📱 Digite o código 2FA: ").strip()
+        code = self.challenge_solver("2fa_code").strip()
         identifier = login_data.get("two_factor_info", {}).get("two_factor_identifier", "")
 
         try:
@@ -358,18 +737,63 @@ class InstagramWebAPI:
     # SESSÃO PERSISTENTE (SALVAR/CARREGAR)
     # ============================================
 
-    def save_session(self, filepath: str):
-        """Salva cookies e dados de sessão em arquivo"""
-        data = {
+    def _session_data(self) -> Dict[str, Any]:
+        """Estado serializável da sessão (cookies + identificação)"""
+        return {
             "cookies": dict(self.session.cookies),
+            "cookie_expires": {
+                c.name: c.expires for c in self.session.cookies if c.expires
+            },
             "user_id": self.user_id,
             "username": self.username,
             "csrf_token": self.csrf_token,
             "saved_at": datetime.now().isoformat(),
         }
+
+    def _restore_session(self, data: Dict[str, Any], verify: bool = True) -> bool:
+        """
+        Restaura o estado salvo por _session_data. Retorna True se válida.
+        verify=False pula o request de verificação (só checa os cookies).
+        """
+        # Limpar cookies antigos antes de restaurar
+        self.session.cookies.clear()
+
+        # Restaurar cookies
+        expires = data.get("cookie_expires", {})
+        for name, value in data.get("cookies", {}).items():
+            self.session.cookies.set(name, value, expires=expires.get(name))
+
+        self.user_id = data.get("user_id")
+        self.username = data.get("username")
+        self.csrf_token = data.get("csrf_token", "")
+        self._set_ajax_headers()
+
+        # Verificar se sessão ainda é válida
+        if self._verify_session(probe=verify):
+            self.is_authenticated = True
+            logger.info(f"Sessão restaurada: @{self.username}")
+            return True
+
+        logger.warning("Sessão expirada")
+        return False
+
+    def save_session(self, filepath: str):
+        """
+        Salva cookies e dados de sessão em arquivo.
+        Escrita atômica (tmp + os.replace); caminhos .gz são comprimidos.
+        """
+        data = self._session_data()
+        if orjson is not None:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(data, indent=2).encode()
+
         os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp = filepath + ".tmp"
+        opener = gzip.open if filepath.endswith(".gz") else open
+        with opener(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, filepath)
         logger.info(f"Sessão salva em {filepath}")
 
     def load_session(self, filepath: str) -> bool:
@@ -378,36 +802,111 @@ class InstagramWebAPI:
             return False
 
         try:
-            with open(filepath) as f:
-                data = json.load(f)
+            opener = gzip.open if filepath.endswith(".gz") else open
+            with opener(filepath, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return self._restore_session(data)
+        except Exception as e:
+            logger.warning(f"Erro ao carregar sessão: {e}")
+            return False
 
-            # Limpar cookies antigos antes de restaurar
-            self.session.cookies.clear()
+    # --- Sessões de várias contas num único SQLite ---
 
-            # Restaurar cookies
-            for name, value in data.get("cookies", {}).items():
-                self.session.cookies.set(name, value)
+    @staticmethod
+    def _session_db(db_path: str) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "username TEXT PRIMARY KEY, blob BLOB NOT NULL, saved_at INTEGER NOT NULL)"
+        )
+        return conn
 
-            self.user_id = data.get("user_id")
-            self.username = data.get("username")
-            self.csrf_token = data.get("csrf_token", "")
-            self._set_ajax_headers()
+    @staticmethod
+    def _dump_blob(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
 
-            # Verificar se sessão ainda é válida
-            if self._verify_session():
-                self.is_authenticated = True
-                logger.info(f"Sessão restaurada: @{self.username}")
-                return True
+    @staticmethod
+    def _load_blob(blob: bytes) -> Dict[str, Any]:
+        return orjson.loads(blob) if orjson is not None else json.loads(blob)
+
+    def save_session_db(self, db_path: str, username: str = None):
+        """Salva a sessão no banco compartilhado (upsert atômico por username)"""
+        username = (username or self.username or "").lower()
+        if not username:
+            raise ValueError("username necessário para salvar sessão no banco")
+        conn = self._session_db(db_path)
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (username, blob, saved_at) VALUES (?, ?, ?)",
+                (username, self._dump_blob(self._session_data()), int(time.time())),
+            )
+        finally:
+            conn.close()
+        logger.info(f"Sessão de @{username} salva em {db_path}")
 
-            logger.warning("Sessão expirada")
+    def load_session_db(self, db_path: str, username: str) -> bool:
+        """Carrega do banco compartilhado a sessão de `username`. Retorna True se válida."""
+        if not os.path.exists(db_path):
             return False
-
+        try:
+            conn = self._session_db(db_path)
+            try:
+                row = conn.execute(
+                    "SELECT blob FROM sessions WHERE username = ?", (username.lower(),)
+                ).fetchone()
+            finally:
+                conn.close()
+            if row is None:
+                return False
+            return self._restore_session(self._load_blob(row[0]))
         except Exception as e:
-            logger.warning(f"Erro ao carregar sessão: {e}")
+            logger.warning(f"Erro ao carregar sessão de @{username}: {e}")
             return False
 
-    def _verify_session(self) -> bool:
-        """Verifica se a sessão está válida fazendo um request simples"""
+    @classmethod
+    def iter_sessions(cls, db_path: str, verify: bool = False,
+                      **kwargs) -> Iterator[Tuple[str, "InstagramWebAPI"]]:
+        """
+        Clientes já autenticados para todas as sessões válidas do banco
+        (uma única consulta). verify=True confirma cada uma com um request;
+        por padrão só os cookies são checados. kwargs vão para __init__.
+        """
+        if not os.path.exists(db_path):
+            return
+        conn = cls._session_db(db_path)
+        try:
+            rows = conn.execute("SELECT username, blob FROM sessions").fetchall()
+        finally:
+            conn.close()
+
+        for username, blob in rows:
+            api = cls(**kwargs)
+            try:
+                if api._restore_session(cls._load_blob(blob), verify=verify):
+                    yield username, api
+            except Exception as e:
+                logger.warning(f"Erro ao carregar sessão de @{username}: {e}")
+
+    def _verify_session(self, probe: bool = True) -> bool:
+        """
+        Verifica se a sessão está válida fazendo um request simples.
+        probe=False fica só na checagem local dos cookies.
+        """
+        # Checagem local primeiro: sem sessionid/ds_user_id ou com sessionid
+        # expirado não adianta gastar um round-trip HTTPS
+        jar = {c.name: c for c in self.session.cookies}
+        sessionid = jar.get("sessionid")
+        if sessionid is None or not sessionid.value or "ds_user_id" not in jar:
+            return False
+        if sessionid.expires and sessionid.expires <= time.time():
+            return False
+        if not probe:
+            return True
+
         try:
             r = self.session.get(
                 f"{self.API_URL}/accounts/edit/web_form_data/",
@@ -425,7 +924,40 @@ class InstagramWebAPI:
     # ============================================
 
     def get_user_info(self, username: str) -> Optional[WebUser]:
-        """Obtém informações de um perfil"""
+        """
+        Obtém informações de um perfil.
+        Cache de USER_INFO_TTL por username; chamadas concorrentes para o
+        mesmo username compartilham um único request (single-flight).
+        """
+        key = username.lower()
+        with self._user_info_lock:
+            cached = self._user_info_cache.get(key)
+            if cached and time.time() - cached[1] < self.USER_INFO_TTL:
+                return cached[0]
+            future = self._user_info_inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._user_info_inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        user = None
+        try:
+            user = self._fetch_user_info(username)
+        finally:
+            with self._user_info_lock:
+                if user:
+                    self._user_info_cache.pop(key, None)
+                    self._user_info_cache[key] = (user, time.time())
+                    if len(self._user_info_cache) > self.USER_INFO_MAX:
+                        # dict mantém ordem de inserção: remove o mais antigo
+                        del self._user_info_cache[next(iter(self._user_info_cache))]
+                del self._user_info_inflight[key]
+            future.set_result(user)
+        return user
+
+    def _fetch_user_info(self, username: str) -> Optional[WebUser]:
         try:
             data = self._api_get(
                 "users/web_profile_info/",
@@ -435,7 +967,7 @@ class InstagramWebAPI:
             if not user_data:
                 return None
 
-            return WebUser(
+            user = WebUser(
                 pk=int(user_data.get("id", 0)),
                 username=user_data.get("username", ""),
                 full_name=user_data.get("full_name", ""),
@@ -448,14 +980,56 @@ class InstagramWebAPI:
                 profile_pic_url=user_data.get("profile_pic_url_hd", ""),
                 external_url=user_data.get("external_url", ""),
             )
+            if user.pk:
+                self._user_id_cache[username.lower()] = (user.pk, time.time())
+            return user
         except Exception as e:
             logger.error(f"Erro ao buscar perfil @{username}: {e}")
             return None
 
+    def _cached_user_id(self, username: str) -> Optional[int]:
+        cached = self._user_id_cache.get(username.lower())
+        if cached and time.time() - cached[1] < self.USER_ID_TTL:
+            return cached[0]
+        return None
+
     def get_user_id_from_username(self, username: str) -> Optional[int]:
-        """Obtém user ID a partir do username"""
+        """Obtém user ID a partir do username (cache de USER_ID_TTL)"""
+        user_id = self._cached_user_id(username)
+        if user_id:
+            return user_id
+
         user = self.get_user_info(username)
-        return user.pk if user else None
+        return user.pk if user and user.pk else None
+
+    def get_user_bundle(self, username: str, medias_amount: int = 12) -> Dict[str, Any]:
+        """
+        Perfil + mídias recentes + stories de um usuário em paralelo.
+        Com o user ID em cache as três buscas saem juntas; sem ele, mídias e
+        stories saem assim que o perfil resolve o ID. Cada uma usa um
+        endpoint diferente (users / graphql / feed), então não disputam o
+        mesmo bucket do rate limiter.
+        """
+        bundle: Dict[str, Any] = {"user": None, "medias": [], "stories": []}
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            info_future = pool.submit(self.get_user_info, username)
+
+            user_id = self._cached_user_id(username)
+            if not user_id:
+                user = info_future.result()
+                if not user or not user.pk:
+                    return bundle
+                user_id = user.pk
+
+            medias_future = pool.submit(self.user_medias, user_id, medias_amount)
+            stories_future = pool.submit(self.user_stories, user_id)
+
+            bundle["user"] = info_future.result()
+            bundle["medias"] = medias_future.result()
+            bundle["stories"] = stories_future.result()
+
+        return bundle
 
     def get_account_info(self) -> Optional[WebUser]:
         """Obtém informações da própria conta"""
@@ -487,21 +1061,11 @@ class InstagramWebAPI:
                     params=params,
                 )
 
-                users = data.get("users", [])
-                for u in users:
-                    followers.append(WebUser(
-                        pk=u.get("pk", 0),
-                        username=u.get("username", ""),
-                        full_name=u.get("full_name", ""),
-                        is_private=u.get("is_private", False),
-                        is_verified=u.get("is_verified", False),
-                        profile_pic_url=u.get("profile_pic_url", ""),
-                    ))
+                followers.extend(map(WebUser.from_api_dict, data.get("users", [])))
 
                 if not data.get("next_max_id"):
                     break
                 end_cursor = data["next_max_id"]
-                self._delay(1, 3)
 
         except Exception as e:
             logger.error(f"Erro ao listar followers de {user_id}: {e}")
@@ -525,26 +1089,125 @@ class InstagramWebAPI:
                     params=params,
                 )
 
-                users = data.get("users", [])
-                for u in users:
-                    following.append(WebUser(
-                        pk=u.get("pk", 0),
-                        username=u.get("username", ""),
-                        full_name=u.get("full_name", ""),
-                        is_private=u.get("is_private", False),
-                        is_verified=u.get("is_verified", False),
-                    ))
+                following.extend(map(WebUser.from_api_dict, data.get("users", [])))
 
                 if not data.get("next_max_id"):
                     break
                 end_cursor = data["next_max_id"]
-                self._delay(1, 3)
 
         except Exception as e:
             logger.error(f"Erro ao listar following de {user_id}: {e}")
 
         return following[:amount]
 
+    # ============================================
+    # SEGUIDORES / SEGUINDO (ASYNC)
+    # ============================================
+    # As páginas de um mesmo usuário continuam sequenciais (cursor), mas
+    # vários usuários podem ser paginados em paralelo:
+    #   await api.followers_of_many([id1, id2, ...], amount=200)
+    # Com httpx[http2] instalado as requisições concorrentes compartilham
+    # uma conexão HTTP/2; senão cai para aiohttp (HTTP/1.1, pool de conexões).
+
+    def _async_session(self, limit: int = 20):
+        """
+        Cliente async com os mesmos headers/cookies da sessão requests.
+        httpx.AsyncClient (HTTP/2) se disponível, senão aiohttp.ClientSession.
+        """
+        _load_async_clients()
+        if httpx is None and aiohttp is None:
+            raise RuntimeError("Nenhum cliente async instalado (pip install 'httpx[http2]' ou aiohttp)")
+        self._refresh_csrf()
+        headers = {
+            k: v for k, v in self.session.headers.items()
+            if k.lower() != "accept-encoding"
+        }
+        cookies = self.session.cookies.get_dict()
+        if httpx is not None:
+            return httpx.AsyncClient(
+                http2=True,
+                headers=headers,
+                cookies=cookies,
+                proxy=self._proxy,
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+            )
+        return aiohttp.ClientSession(
+            headers=headers,
+            cookies=cookies,
+            connector=aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300),
+        )
+
+    async def _api_get_async(self, http, endpoint: str,
+                             params: dict = None, timeout: int = 15) -> dict:
+        """GET async para API v1 web (httpx ou aiohttp, conforme _async_session)"""
+        url = f"{self.API_URL}/{endpoint}"
+        if httpx is not None and isinstance(http, httpx.AsyncClient):
+            r = await http.get(url, params=params, timeout=timeout)
+            r.raise_for_status()
+            return _parse_json(r)
+
+        async with http.get(
+            url,
+            params=params,
+            proxy=self._proxy,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as r:
+            r.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(await r.read())
+            return await r.json(content_type=None)
+
+    async def _friendships_async(self, http, user_id: int,
+                                 kind: str, amount: int, extra_params: dict = None) -> List[WebUser]:
+        users: List[WebUser] = []
+        end_cursor = ""
+        try:
+            while len(users) < amount:
+                params = {"count": min(amount, 50), **(extra_params or {})}
+                if end_cursor:
+                    params["max_id"] = end_cursor
+
+                data = await self._api_get_async(http, f"friendships/{user_id}/{kind}/", params)
+                users.extend(map(WebUser.from_api_dict, data.get("users", [])))
+
+                if not data.get("next_max_id"):
+                    break
+                end_cursor = data["next_max_id"]
+                await asyncio.sleep(random.uniform(1, 3))
+
+        except Exception as e:
+            logger.error(f"Erro ao listar {kind} de {user_id}: {e}")
+
+        return users[:amount]
+
+    async def user_followers_async(self, user_id: int, amount: int = 50,
+                                   http=None) -> List[WebUser]:
+        """Versão async de user_followers"""
+        if http is None:
+            async with self._async_session() as own:
+                return await self.user_followers_async(user_id, amount, own)
+        return await self._friendships_async(
+            http, user_id, "followers", amount, {"search_surface": "follow_list_page"}
+        )
+
+    async def user_following_async(self, user_id: int, amount: int = 50,
+                                   http=None) -> List[WebUser]:
+        """Versão async de user_following"""
+        if http is None:
+            async with self._async_session() as own:
+                return await self.user_following_async(user_id, amount, own)
+        return await self._friendships_async(http, user_id, "following", amount)
+
+    async def followers_of_many(self, user_ids: List[int], amount: int = 50,
+                                concurrency: int = 8) -> Dict[int, List[WebUser]]:
+        """Seguidores de vários usuários em paralelo (no máximo `concurrency` por vez)"""
+        sem = asyncio.Semaphore(concurrency)
+        async with self._async_session() as http:
+            async def one(uid: int):
+                async with sem:
+                    return uid, await self.user_followers_async(uid, amount, http)
+            return dict(await asyncio.gather(*(one(uid) for uid in user_ids)))
+
     # ============================================
     # FOLLOW / UNFOLLOW
     # ============================================
@@ -564,6 +1227,10 @@ class InstagramWebAPI:
             logger.error(f"Erro ao seguir {user_id}: {e}")
             return False
 
+    def user_follow_many(self, user_ids: List[int]) -> Dict[int, bool]:
+        """Segue vários usuários; retorna {user_id: sucesso}"""
+        return self._bulk_write(self.user_follow, user_ids)
+
     def user_unfollow(self, user_id: int) -> bool:
         """Deixa de seguir um usuário"""
         try:
@@ -577,6 +1244,10 @@ class InstagramWebAPI:
             logger.error(f"Erro ao unfollow {user_id}: {e}")
             return False
 
+    def user_unfollow_many(self, user_ids: List[int]) -> Dict[int, bool]:
+        """Deixa de seguir vários usuários; retorna {user_id: sucesso}"""
+        return self._bulk_write(self.user_unfollow, user_ids)
+
     # ============================================
     # CURTIR / DESCURTIR
     # ============================================
@@ -593,6 +1264,10 @@ class InstagramWebAPI:
             logger.error(f"Erro ao curtir {media_id}: {e}")
             return False
 
+    def media_like_many(self, media_ids: List[str]) -> Dict[str, bool]:
+        """Curte várias mídias; retorna {media_id: sucesso}"""
+        return self._bulk_write(self.media_like, media_ids)
+
     def media_unlike(self, media_id: str) -> bool:
         """Descurte uma mídia"""
         try:
@@ -631,26 +1306,19 @@ class InstagramWebAPI:
         try:
             # Primeiro tentar pegar do web_profile_info que já vem com mídias
             # Buscar username pelo user_id (se não tiver)
-            r = self.session.get(
-                f"{self.BASE_URL}/graphql/query/",
-                params={
-                    "query_hash": "58b6785bea111c67129decfb136ab174",
-                    "variables": json.dumps({
-                        "id": str(user_id),
-                        "first": min(amount, 50),
-                    }),
-                },
-                timeout=15,
-            )
+            r = self._graphql_get(_gql_params(self.Q_USER_MEDIAS, {
+                "id": str(user_id),
+                "first": min(amount, 50),
+            }))
             if r.status_code == 200:
-                data = r.json()
+                data = _parse_json(r)
                 edges = (
                     data.get("data", {})
                     .get("user", {})
                     .get("edge_owner_to_timeline_media", {})
                     .get("edges", [])
                 )
-                for edge in edges[:amount]:
+                for edge in edges:
                     node = edge.get("node", {})
                     taken_at = None
                     if node.get("taken_at_timestamp"):
@@ -679,28 +1347,34 @@ class InstagramWebAPI:
 
     def media_likers(self, media_shortcode: str, amount: int = 50) -> List[WebUser]:
         """Lista quem curtiu uma mídia"""
+        likers, _ = self.media_likers_page(media_shortcode, amount)
+        return likers
+
+    def media_likers_page(self, media_shortcode: str, amount: int = 50,
+                          after: str = "") -> Tuple[List[WebUser], str]:
+        """
+        Uma página de curtidores a partir do cursor `after`.
+        Retorna (curtidores, cursor da próxima página ou "" se acabou).
+        """
         likers = []
+        next_cursor = ""
+        variables = {
+            "shortcode": media_shortcode,
+            "first": min(amount, 50),
+        }
+        if after:
+            variables["after"] = after
+
         try:
-            r = self.session.get(
-                f"{self.GRAPHQL_URL}/",
-                params={
-                    "query_hash": "d5d763b1e2acf209d62d22d184f1b5f2",
-                    "variables": json.dumps({
-                        "shortcode": media_shortcode,
-                        "first": min(amount, 50),
-                    }),
-                },
-                timeout=15,
-            )
+            r = self._graphql_get(_gql_params(self.Q_MEDIA_LIKERS, variables))
             if r.status_code == 200:
-                data = r.json()
-                edges = (
+                data = _parse_json(r)
+                liked_by = (
                     data.get("data", {})
                     .get("shortcode_media", {})
                     .get("edge_liked_by", {})
-                    .get("edges", [])
                 )
-                for edge in edges[:amount]:
+                for edge in liked_by.get("edges", []):
                     node = edge.get("node", {})
                     likers.append(WebUser(
                         pk=int(node.get("id", 0)),
@@ -711,10 +1385,14 @@ class InstagramWebAPI:
                         profile_pic_url=node.get("profile_pic_url", ""),
                     ))
 
+                page_info = liked_by.get("page_info", {})
+                if page_info.get("has_next_page"):
+                    next_cursor = page_info.get("end_cursor") or ""
+
         except Exception as e:
             logger.error(f"Erro ao buscar likers: {e}")
 
-        return likers
+        return likers, next_cursor
 
     def hashtag_medias_top(self, hashtag: str, amount: int = 20) -> List[WebMedia]:
         """Busca mídias top de uma hashtag"""
@@ -722,19 +1400,12 @@ class InstagramWebAPI:
         hashtag = hashtag.strip().lstrip("#")
 
         try:
-            r = self.session.get(
-                f"{self.GRAPHQL_URL}/",
-                params={
-                    "query_hash": "174a21c41ef669bdf70474b0a94ee3ad",
-                    "variables": json.dumps({
-                        "tag_name": hashtag,
-                        "first": min(amount, 50),
-                    }),
-                },
-                timeout=15,
-            )
+            r = self._graphql_get(_gql_params(self.Q_HASHTAG_MEDIAS, {
+                "tag_name": hashtag,
+                "first": min(amount, 50),
+            }))
             if r.status_code == 200:
-                data = r.json()
+                data = _parse_json(r)
                 edges = (
                     data.get("data", {})
                     .get("hashtag", {})
@@ -748,9 +1419,8 @@ class InstagramWebAPI:
                     .get("edge_hashtag_to_media", {})
                     .get("edges", [])
                 )
-                all_edges = edges + recent_edges
-
-                for edge in all_edges[:amount]:
+                # Top primeiro, depois recentes, sem concatenar/copiar as listas
+                for edge in islice(chain(edges, recent_edges), amount):
                     node = edge.get("node", {})
                     taken_at = None
                     if node.get("taken_at_timestamp"):
@@ -801,27 +1471,50 @@ class InstagramWebAPI:
             logger.error(f"Erro ao buscar stories de {user_id}: {e}")
             return []
 
+    @staticmethod
+    def _story_owner_id(story_id) -> str:
+        """Reel (dono) a partir do ID "mediaid_ownerid" do story"""
+        sid = str(story_id)
+        return sid.split("_")[1] if "_" in sid else sid
+
     def story_seen(self, story_ids: List[str], reel_ids: List[str] = None) -> bool:
-        """Marca stories como vistos"""
+        """Marca stories como vistos (todos num único POST)"""
+        if not story_ids:
+            return True
         try:
             # Montar payload de visualização
-            reels = {}
             timestamp = str(int(time.time()))
-            for i, sid in enumerate(story_ids):
-                reel_id = reel_ids[i] if reel_ids and i < len(reel_ids) else sid.split("_")[1] if "_" in str(sid) else str(sid)
-                reels[f"{sid}_{reel_id}"] = [f"{timestamp}_{timestamp}"]
+            seen_pair = [f"{timestamp}_{timestamp}"]  # mesmo valor para todos
+            reel_ids = reel_ids or []
+            reels = {
+                f"{sid}_{reel_ids[i] if i < len(reel_ids) else self._story_owner_id(sid)}": seen_pair
+                for i, sid in enumerate(story_ids)
+            }
 
-            data = self._api_post(
-                "stories/reel/seen/",
-                data={
-                    "reelMediaId": story_ids[0] if story_ids else "",
+            payload = {
+                "reels": json.dumps(reels, separators=(",", ":")),
+                "live_vods": "{}",
+                "nav_chain": "",
+                "reel_media_skipped": "{}",
+                "live_vods_skipped": "{}",
+                "nuxes": "{}",
+                "nuxes_skipped": "{}",
+            }
+            # Campos legados do endpoint web, só fazem sentido para 1 story
+            if len(story_ids) == 1:
+                payload.update({
+                    "reelMediaId": story_ids[0],
                     "reelMediaOwnerId": "",
                     "reelId": "",
                     "reelMediaTakenAt": timestamp,
                     "viewSeenAt": timestamp,
-                },
-            )
-            return data.get("status") == "ok"
+                })
+
+            data = self._api_post("stories/reel/seen/", data=payload)
+            ok = data.get("status") == "ok"
+            if ok:
+                logger.debug(f"{len(reels)} stories marcados como vistos")
+            return ok
         except Exception as e:
             logger.error(f"Erro ao marcar stories vistos: {e}")
             return False
@@ -830,125 +1523,232 @@ class InstagramWebAPI:
     # HELPERS DE UPLOAD
     # ============================================
 
-    @staticmethod
-    def _get_video_info(video_path: str) -> Dict[str, Any]:
-        """Extrai metadados do vídeo via ffprobe"""
-        try:
-            cmd = [
-                "ffprobe", "-v", "quiet", "-print_format", "json",
-                "-show_streams", "-show_format", video_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            data = json.loads(result.stdout)
+    # Usado quando ffprobe falha ou não está instalado
+    DEFAULT_VIDEO_INFO = {"duration": 15.0, "duration_ms": 15000, "width": 1080, "height": 1920}
 
-            video_stream = None
-            for stream in data.get("streams", []):
-                if stream.get("codec_type") == "video":
-                    video_stream = stream
-                    break
+    # Análise curta da entrada: para clipes de redes sociais o padrão
+    # (5 MB / 5 s) só atrasa a inicialização, sem mudar o resultado
+    FFMPEG_PROBE_FLAGS = ("-probesize", "500000", "-analyzeduration", "500000")
+
+    # Capa só é exibida pequena: no máximo 720px de largura (altura par)
+    THUMB_OUTPUT_FLAGS = (
+        "-vframes", "1", "-vf", "scale='min(720,iw)':-2", "-q:v", "3", "-threads", "1",
+    )
 
-            if not video_stream:
-                raise ValueError("Nenhum stream de vídeo encontrado")
+    @classmethod
+    def _ffprobe_cmd(cls, video_path: str) -> List[str]:
+        return [
+            "ffprobe", "-v", "quiet", *cls.FFMPEG_PROBE_FLAGS,
+            "-print_format", "json", "-show_streams", "-show_format", video_path
+        ]
 
-            duration = float(data.get("format", {}).get("duration", 0))
-            width = int(video_stream.get("width", 0))
-            height = int(video_stream.get("height", 0))
+    @staticmethod
+    def _parse_video_info(stdout: bytes) -> Dict[str, Any]:
+        """Metadados a partir da saída JSON do ffprobe"""
+        data = orjson.loads(stdout) if orjson is not None else json.loads(stdout)
+
+        video_stream = None
+        for stream in data.get("streams", []):
+            if stream.get("codec_type") == "video":
+                video_stream = stream
+                break
+
+        if not video_stream:
+            raise ValueError("Nenhum stream de vídeo encontrado")
+
+        duration = float(data.get("format", {}).get("duration", 0))
+        width = int(video_stream.get("width", 0))
+        height = int(video_stream.get("height", 0))
+
+        return {
+            "duration": duration,
+            "duration_ms": int(duration * 1000),
+            "width": width,
+            "height": height,
+        }
 
-            return {
-                "duration": duration,
-                "duration_ms": int(duration * 1000),
-                "width": width,
-                "height": height,
-            }
+    @classmethod
+    def _probe_video_info(cls, video_path: str) -> Optional[Dict[str, Any]]:
+        """Metadados do vídeo via ffprobe; None se o probe falhar"""
+        try:
+            result = subprocess.run(cls._ffprobe_cmd(video_path), capture_output=True, timeout=30)
+            return cls._parse_video_info(result.stdout)
         except FileNotFoundError:
             logger.warning("ffprobe não disponível. Usando valores padrão.")
-            return {"duration": 15.0, "duration_ms": 15000, "width": 1080, "height": 1920}
         except Exception as e:
             logger.warning(f"Erro ao extrair info do vídeo: {e}")
-            return {"duration": 15.0, "duration_ms": 15000, "width": 1080, "height": 1920}
+        return None
 
-    @staticmethod
-    def _extract_thumbnail(video_path: str, output_path: str = None) -> Optional[str]:
+    @classmethod
+    def _get_video_info(cls, video_path: str) -> Dict[str, Any]:
+        """Extrai metadados do vídeo via ffprobe (DEFAULT_VIDEO_INFO se falhar)"""
+        return cls._probe_video_info(video_path) or dict(cls.DEFAULT_VIDEO_INFO)
+
+    @classmethod
+    async def _get_video_info_async(cls, video_path: str) -> Dict[str, Any]:
+        """Versão async de _get_video_info (não bloqueia o event loop)"""
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cls._ffprobe_cmd(video_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+            return cls._parse_video_info(stdout)
+        except FileNotFoundError:
+            logger.warning("ffprobe não disponível. Usando valores padrão.")
+            return dict(cls.DEFAULT_VIDEO_INFO)
+        except Exception as e:
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+            logger.warning(f"Erro ao extrair info do vídeo: {e}")
+            return dict(cls.DEFAULT_VIDEO_INFO)
+
+    @classmethod
+    def get_videos_info(cls, video_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Metadados de vários vídeos com os ffprobe rodando em paralelo.
+        Útil para preparar uploads em lote; mantém a ordem de video_paths.
+        """
+        async def _gather():
+            return await asyncio.gather(*(cls._get_video_info_async(p) for p in video_paths))
+        return list(asyncio.run(_gather()))
+
+    # ffmpeg imprime no stderr o resumo da entrada; daí saem duração e resolução
+    _FFMPEG_DURATION_RE = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+    _FFMPEG_VIDEO_RE = re.compile(r"Stream #.*?Video:.*?\b(\d{2,5})x(\d{2,5})\b")
+
+    @classmethod
+    def _parse_ffmpeg_banner(cls, stderr: str) -> Optional[Dict[str, Any]]:
+        """Metadados a partir do resumo da entrada que o ffmpeg imprime"""
+        video = cls._FFMPEG_VIDEO_RE.search(stderr)
+        duration = cls._FFMPEG_DURATION_RE.search(stderr)
+        if not video or not duration:
+            return None
+        h, m, sec = duration.groups()
+        seconds = int(h) * 3600 + int(m) * 60 + float(sec)
+        return {
+            "duration": seconds,
+            "duration_ms": int(seconds * 1000),
+            "width": int(video.group(1)),
+            "height": int(video.group(2)),
+        }
+
+    @classmethod
+    def _probe_and_thumb(cls, video_path: str,
+                         output_path: str = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Metadados e primeiro frame numa única execução do ffmpeg (evita o
+        custo de subir ffprobe e ffmpeg separadamente). Metadados são None
+        se nem ffmpeg nem ffprobe conseguirem lê-los.
+        """
+        if not output_path:
+            output_path = video_path.rsplit(".", 1)[0] + "_thumb.jpg"
+        cmd = [
+            "ffmpeg", "-hide_banner", "-nostats", "-y", *cls.FFMPEG_PROBE_FLAGS,
+            "-ss", "0", "-i", video_path,
+            *cls.THUMB_OUTPUT_FLAGS, output_path
+        ]
+        info = None
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
+            info = cls._parse_ffmpeg_banner(result.stderr.decode("utf-8", "replace"))
+        except FileNotFoundError:
+            logger.warning("ffmpeg não disponível. Usando valores padrão.")
+            return None, None
+        except Exception as e:
+            logger.warning(f"Erro ao extrair info/thumbnail do vídeo: {e}")
+
+        thumb = output_path if os.path.exists(output_path) else None
+        if info is None:
+            # Saída inesperada: cai para o ffprobe (JSON estruturado)
+            info = cls._probe_video_info(video_path)
+        return info, thumb
+
+    @classmethod
+    def _extract_thumbnail(cls, video_path: str, output_path: str = None) -> Optional[str]:
         """Extrai primeiro frame do vídeo como thumbnail"""
         if not output_path:
             output_path = video_path.rsplit(".", 1)[0] + "_thumb.jpg"
         try:
             cmd = [
-                "ffmpeg", "-y", "-i", video_path,
-                "-vframes", "1", "-q:v", "2", output_path
+                "ffmpeg", "-y", "-loglevel", "error", *cls.FFMPEG_PROBE_FLAGS,
+                "-ss", "0", "-i", video_path, *cls.THUMB_OUTPUT_FLAGS, output_path
             ]
-            subprocess.run(cmd, capture_output=True, timeout=30)
+            # Saída do ffmpeg não é usada: nada de pipes/buffers para ela
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
             if os.path.exists(output_path):
                 return output_path
         except Exception as e:
             logger.warning(f"Erro ao extrair thumbnail: {e}")
         return None
 
+    @staticmethod
+    @contextmanager
+    def _file_body(path: str) -> Iterator["_FileChunks"]:
+        """Arquivo aberto como corpo de upload em blocos (ver _FileChunks)"""
+        with open(path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                raise ValueError(f"Arquivo vazio: {path}")
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+            yield _FileChunks(f, size)
+
     def _upload_photo_binary(self, image_path: str, upload_id: str,
                               is_story: bool = False) -> bool:
         """Upload de foto binária para o CDN do Instagram (rupload_igphoto)"""
-        with open(image_path, "rb") as f:
-            image_data = f.read()
-
+        image_size = os.path.getsize(image_path)
         ext = os.path.splitext(image_path)[1].lower()
         content_type = {
             ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png",
         }.get(ext, "image/jpeg")
 
-        upload_name = f"{upload_id}_0_{random.randint(1000000000, 9999999999)}"
+        upload_name = _upload_name(upload_id)
 
         rupload_params = {
-            "retry_context": json.dumps({
-                "num_step_auto_retry": 0, "num_reupload": 0, "num_step_manual_retry": 0
-            }),
+            "retry_context": _RETRY_CONTEXT_JSON,
             "media_type": "1",
             "xsharing_user_ids": "[]",
             "upload_id": upload_id,
-            "image_compression": json.dumps({
-                "lib_name": "moz", "lib_version": "3.1.m", "quality": "80"
-            }),
+            "image_compression": _IMAGE_COMPRESSION_JSON,
         }
 
         headers = {
+            **_RUPLOAD_BODY_HEADERS,
             "X-Entity-Name": upload_name,
-            "X-Entity-Length": str(len(image_data)),
+            "X-Entity-Length": str(image_size),
             "X-Entity-Type": content_type,
             "X-Instagram-Rupload-Params": json.dumps(rupload_params),
-            "Offset": "0",
-            "Content-Type": "application/octet-stream",
         }
 
-        r = self.session.post(
-            f"https://www.instagram.com/rupload_igphoto/{upload_name}",
-            data=image_data,
-            headers=headers,
-            timeout=60,
-        )
+        with self._file_body(image_path) as image_data:
+            r = self.session.post(
+                f"https://www.instagram.com/rupload_igphoto/{upload_name}",
+                data=image_data,
+                headers=headers,
+                timeout=60,
+            )
 
         if r.status_code == 200:
-            logger.info(f"Foto uploaded: {r.json().get('status', 'ok')}")
+            logger.info(f"Foto uploaded: {_parse_json(r).get('status', 'ok')}")
             return True
         else:
             logger.error(f"Upload foto falhou: HTTP {r.status_code}")
             return False
 
-    def _upload_video_binary(self, video_path: str, upload_id: str,
-                              video_info: dict,
-                              is_clips: bool = False,
-                              is_story: bool = False) -> bool:
-        """Upload de vídeo binário para o CDN do Instagram (rupload_igvideo)"""
-        with open(video_path, "rb") as f:
-            video_data = f.read()
-
+    def _video_rupload_request(self, upload_id: str, video_info: dict, video_size: int,
+                               is_clips: bool = False,
+                               is_story: bool = False) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """URL + headers das fases init (GET) e envio (POST) do rupload_igvideo"""
         waterfall_id = str(uuid.uuid4())
-        upload_name = f"{upload_id}_0_{random.randint(1000000000, 9999999999)}"
+        upload_name = _upload_name(upload_id)
 
         rupload_params = {
-            "retry_context": json.dumps({
-                "num_step_auto_retry": 0, "num_reupload": 0, "num_step_manual_retry": 0
-            }),
+            "retry_context": _RETRY_CONTEXT_JSON,
             "media_type": "2",
-            "xsharing_user_ids": json.dumps([str(self.user_id)]) if self.user_id else "[]",
+            "xsharing_user_ids": self._xsharing_user_ids(),
             "upload_id": upload_id,
             "upload_media_duration_ms": str(video_info["duration_ms"]),
             "upload_media_width": str(video_info["width"]),
@@ -964,48 +1764,164 @@ class InstagramWebAPI:
 
         rp_json = json.dumps(rupload_params)
 
-        # Fase 1: Inicializar upload (GET)
-        init_headers = {
-            "Accept-Encoding": "gzip, deflate",
+        # Headers em comum às duas fases; cada fase só acrescenta os fixos dela
+        common = {
             "X-Instagram-Rupload-Params": rp_json,
             "X_FB_VIDEO_WATERFALL_ID": waterfall_id,
-            "X-Entity-Type": "video/mp4",
             "X-Entity-Name": upload_name,
-            "X-Entity-Length": str(len(video_data)),
+            "X-Entity-Length": str(video_size),
         }
+        init_headers = {**_VIDEO_INIT_HEADERS, **common}
+        upload_headers = {**_VIDEO_BODY_HEADERS, **common}
+        url = f"https://www.instagram.com/rupload_igvideo/{upload_name}"
+        return url, init_headers, upload_headers
 
-        r_init = self.session.get(
-            f"https://www.instagram.com/rupload_igvideo/{upload_name}",
-            headers=init_headers,
-            timeout=30,
+    def _upload_video_binary(self, video_path: str, upload_id: str,
+                              video_info: dict,
+                              is_clips: bool = False,
+                              is_story: bool = False) -> bool:
+        """Upload de vídeo binário para o CDN do Instagram (rupload_igvideo)"""
+        url, init_headers, upload_headers = self._video_rupload_request(
+            upload_id, video_info, os.path.getsize(video_path), is_clips, is_story
         )
+
+        # Fase 1: Inicializar upload (GET)
+        r_init = self.session.get(url, headers=init_headers, timeout=30)
         logger.debug(f"Video init: {r_init.status_code}")
 
         # Fase 2: Enviar bytes (POST)
-        upload_headers = {
-            "Offset": "0",
-            "X-Entity-Name": upload_name,
-            "X-Entity-Length": str(len(video_data)),
-            "Content-Type": "application/octet-stream",
-            "X-Entity-Type": "video/mp4",
-            "X-Instagram-Rupload-Params": rp_json,
-            "X_FB_VIDEO_WATERFALL_ID": waterfall_id,
-        }
-
-        r = self.session.post(
-            f"https://www.instagram.com/rupload_igvideo/{upload_name}",
-            data=video_data,
-            headers=upload_headers,
-            timeout=120,
-        )
+        with self._file_body(video_path) as video_data:
+            r = self.session.post(url, data=video_data, headers=upload_headers, timeout=120)
 
         if r.status_code == 200:
-            logger.info(f"Vídeo uploaded: {r.json().get('status', 'ok')}")
+            logger.info(f"Vídeo uploaded: {_parse_json(r).get('status', 'ok')}")
             return True
         else:
             logger.error(f"Upload vídeo falhou: HTTP {r.status_code}")
             return False
 
+    async def _upload_video_binary_async(self, video_path: str, upload_id: str,
+                                         video_info: dict, is_clips: bool = False,
+                                         is_story: bool = False, http=None) -> bool:
+        """
+        Versão async de _upload_video_binary (requer httpx). O GET de init sai
+        enquanto o arquivo é aberto; com um `http` compartilhado, uploads
+        simultâneos dividem a mesma conexão HTTP/2.
+        """
+        _load_async_clients()
+        if httpx is None:
+            raise RuntimeError("httpx não instalado (pip install 'httpx[http2]')")
+        if http is None:
+            async with self._async_session() as own:
+                return await self._upload_video_binary_async(
+                    video_path, upload_id, video_info, is_clips, is_story, own
+                )
+
+        video_size = await asyncio.to_thread(os.path.getsize, video_path)
+        url, init_headers, upload_headers = self._video_rupload_request(
+            upload_id, video_info, video_size, is_clips, is_story
+        )
+
+        # Fase 1 (GET de init) em paralelo com a abertura do arquivo
+        init_task = asyncio.create_task(http.get(url, headers=init_headers, timeout=30))
+        f = await asyncio.to_thread(open, video_path, "rb", buffering=0)
+        try:
+            r_init = await init_task
+            logger.debug(f"Video init: {r_init.status_code}")
+
+            async def body():
+                while chunk := await asyncio.to_thread(f.read, _FileChunks.CHUNK_SIZE):
+                    yield chunk
+
+            # Fase 2: Enviar bytes (POST); Content-Length explícito evita chunked
+            r = await http.post(
+                url, content=body(),
+                headers={**upload_headers, "Content-Length": str(video_size)},
+                timeout=120,
+            )
+        finally:
+            init_task.cancel()
+            f.close()
+
+        if r.status_code == 200:
+            logger.info(f"Vídeo uploaded: {_parse_json(r).get('status', 'ok')}")
+            return True
+        logger.error(f"Upload vídeo falhou: HTTP {r.status_code}")
+        return False
+
+    def _xsharing_user_ids(self) -> str:
+        """'["<user_id>"]' da conta logada, recalculado só quando user_id muda"""
+        if self._xsharing_cache[0] != self.user_id:
+            encoded = json.dumps([str(self.user_id)]) if self.user_id else "[]"
+            self._xsharing_cache = (self.user_id, encoded)
+        return self._xsharing_cache[1]
+
+    def _new_upload_id(self) -> str:
+        """upload_id em ms, único mesmo com uploads simultâneos"""
+        with self._upload_id_lock:
+            self._last_upload_id = max(time.time_ns() // 1_000_000, self._last_upload_id + 1)
+            return str(self._last_upload_id)
+
+    def _prepare_video(self, video_path: str, thumbnail_path: str = None
+                       ) -> Tuple[Dict[str, Any], Union[str, Future, None], bool]:
+        """
+        Metadados + thumbnail para um upload de vídeo.
+        Retorna (video_info, thumb, thumb_temporária). Sem thumbnail_path,
+        probe e extração do frame saem de um único ffmpeg; com video_info em
+        cache, thumb é um Future e a extração corre junto com o upload do vídeo.
+        """
+        st = os.stat(video_path)
+        key = (video_path, st.st_mtime_ns, st.st_size)
+        video_info = self._video_info_cache.get(key)
+
+        if video_info is not None and not thumbnail_path:
+            thumb = Future()
+
+            def extract():
+                try:
+                    with self._ffmpeg_slots:
+                        thumb.set_result(self._extract_thumbnail(video_path))
+                except Exception as e:
+                    thumb.set_exception(e)
+
+            threading.Thread(target=extract, daemon=True).start()
+            return video_info, thumb, True
+
+        with self._ffmpeg_slots:
+            if thumbnail_path:
+                if video_info is None:
+                    video_info = self._probe_video_info(video_path)
+                thumb, temp = thumbnail_path, False
+            else:
+                video_info, thumb = self._probe_and_thumb(video_path)
+                temp = True
+
+        # Só probes bem-sucedidos entram no cache: o fallback é refeito no próximo upload
+        if video_info is None:
+            return dict(self.DEFAULT_VIDEO_INFO), thumb, temp
+        self._video_info_cache[key] = video_info
+        return video_info, thumb, temp
+
+    def _upload_video_and_thumb(self, video_path: str, upload_id: str, video_info: dict,
+                                thumb: Union[str, Future, None], temp_thumb: bool,
+                                is_clips: bool = False, is_story: bool = False) -> bool:
+        """Upload do vídeo e da thumbnail (remove a thumbnail temporária no fim)"""
+        try:
+            if not self._upload_video_binary(video_path, upload_id, video_info,
+                                             is_clips=is_clips, is_story=is_story):
+                return False
+            if isinstance(thumb, Future):
+                thumb = thumb.result()
+            if thumb:
+                self._upload_photo_binary(thumb, upload_id, is_story=is_story)
+            return True
+        finally:
+            if isinstance(thumb, Future):
+                # Upload falhou antes da thumbnail: espera a extração para não deixar lixo
+                thumb = None if thumb.exception() else thumb.result()
+            if temp_thumb and thumb and os.path.exists(thumb):
+                os.remove(thumb)
+
     # ============================================
     # UPLOAD: FOTO NO FEED
     # ============================================
@@ -1017,7 +1933,7 @@ class InstagramWebAPI:
             return None
 
         try:
-            upload_id = str(int(time.time() * 1000))
+            upload_id = self._new_upload_id()
 
             if not self._upload_photo_binary(image_path, upload_id):
                 return None
@@ -1040,7 +1956,7 @@ class InstagramWebAPI:
             )
 
             if r.status_code == 200:
-                result = r.json()
+                result = _parse_json(r)
                 if result.get("status") == "ok":
                     media = result.get("media", {})
                     code = media.get("code", "")
@@ -1068,26 +1984,17 @@ class InstagramWebAPI:
             return None
 
         try:
-            upload_id = str(int(time.time() * 1000))
-            video_info = self._get_video_info(video_path)
+            upload_id = self._new_upload_id()
+            video_info, thumb, temp_thumb = self._prepare_video(video_path, thumbnail_path)
 
             logger.info(f"📹 Enviando vídeo: {video_info['width']}x{video_info['height']}, "
                         f"{video_info['duration']:.1f}s")
 
-            # 1. Upload do vídeo
-            if not self._upload_video_binary(video_path, upload_id, video_info):
+            # 1-2. Upload do vídeo + thumbnail (fornecida ou extraída)
+            if not self._upload_video_and_thumb(video_path, upload_id, video_info,
+                                                thumb, temp_thumb):
                 return None
 
-            # 2. Upload da thumbnail (se fornecida ou extrair)
-            thumb = thumbnail_path
-            if not thumb:
-                thumb = self._extract_thumbnail(video_path)
-            if thumb:
-                self._upload_photo_binary(thumb, upload_id)
-                # Limpar thumbnail temporária
-                if not thumbnail_path and os.path.exists(thumb):
-                    os.remove(thumb)
-
             self._delay(3, 6)
             self._refresh_csrf()
 
@@ -1101,7 +2008,7 @@ class InstagramWebAPI:
                 "poster_frame_index": "0",
                 "length": str(video_info["duration"]),
                 "audio_muted": "false",
-                "usertags": json.dumps({"in": []}),
+                "usertags": _EMPTY_USERTAGS_JSON,
                 "date_time_original": now_str,
                 "timezone_offset": "-10800",
                 "clips": json.dumps([{
@@ -1121,7 +2028,7 @@ class InstagramWebAPI:
             )
 
             if r.status_code == 200:
-                result = r.json()
+                result = _parse_json(r)
                 if result.get("status") == "ok":
                     media = result.get("media", {})
                     code = media.get("code", "")
@@ -1148,7 +2055,7 @@ class InstagramWebAPI:
             return None
 
         try:
-            upload_id = str(int(time.time() * 1000))
+            upload_id = self._new_upload_id()
 
             if not self._upload_photo_binary(image_path, upload_id, is_story=True):
                 return None
@@ -1183,7 +2090,7 @@ class InstagramWebAPI:
             )
 
             if r.status_code == 200:
-                result = r.json()
+                result = _parse_json(r)
                 if result.get("status") == "ok":
                     logger.info("📱 Foto publicada nos Stories!")
                     return result
@@ -1209,28 +2116,19 @@ class InstagramWebAPI:
             return None
 
         try:
-            upload_id = str(int(time.time() * 1000))
-            video_info = self._get_video_info(video_path)
+            upload_id = self._new_upload_id()
+            video_info, thumb, temp_thumb = self._prepare_video(video_path, thumbnail_path)
 
             if video_info["duration"] > 60:
                 logger.warning("Stories permitem no máximo 60 segundos de vídeo")
 
             logger.info(f"📱 Enviando story vídeo: {video_info['duration']:.1f}s")
 
-            # 1. Upload do vídeo
-            if not self._upload_video_binary(video_path, upload_id, video_info,
-                                              is_story=True):
+            # 1-2. Upload do vídeo + thumbnail
+            if not self._upload_video_and_thumb(video_path, upload_id, video_info,
+                                                thumb, temp_thumb, is_story=True):
                 return None
 
-            # 2. Upload da thumbnail
-            thumb = thumbnail_path
-            if not thumb:
-                thumb = self._extract_thumbnail(video_path)
-            if thumb:
-                self._upload_photo_binary(thumb, upload_id, is_story=True)
-                if not thumbnail_path and os.path.exists(thumb):
-                    os.remove(thumb)
-
             self._delay(3, 6)
             self._refresh_csrf()
 
@@ -1274,7 +2172,7 @@ class InstagramWebAPI:
             )
 
             if r.status_code == 200:
-                result = r.json()
+                result = _parse_json(r)
                 if result.get("status") == "ok":
                     logger.info("📱 Vídeo publicado nos Stories!")
                     return result
@@ -1300,8 +2198,8 @@ class InstagramWebAPI:
             return None
 
         try:
-            upload_id = str(int(time.time() * 1000))
-            video_info = self._get_video_info(video_path)
+            upload_id = self._new_upload_id()
+            video_info, thumb, temp_thumb = self._prepare_video(video_path, thumbnail_path)
 
             if video_info["duration"] > 90:
                 logger.warning("Reels permitem no máximo 90 segundos")
@@ -1309,20 +2207,11 @@ class InstagramWebAPI:
             logger.info(f"🎬 Enviando Reel: {video_info['width']}x{video_info['height']}, "
                         f"{video_info['duration']:.1f}s")
 
-            # 1. Upload do vídeo (com flag is_clips_video)
-            if not self._upload_video_binary(video_path, upload_id, video_info,
-                                              is_clips=True):
+            # 1-2. Upload do vídeo (com flag is_clips_video) + thumbnail
+            if not self._upload_video_and_thumb(video_path, upload_id, video_info,
+                                                thumb, temp_thumb, is_clips=True):
                 return None
 
-            # 2. Upload da thumbnail
-            thumb = thumbnail_path
-            if not thumb:
-                thumb = self._extract_thumbnail(video_path)
-            if thumb:
-                self._upload_photo_binary(thumb, upload_id)
-                if not thumbnail_path and os.path.exists(thumb):
-                    os.remove(thumb)
-
             self._delay(3, 6)
             self._refresh_csrf()
 
@@ -1339,7 +2228,7 @@ class InstagramWebAPI:
                 "length": str(video_info["duration"]),
                 "audio_muted": "false",
                 "poster_frame_index": "70",
-                "usertags": json.dumps({"in": []}),
+                "usertags": _EMPTY_USERTAGS_JSON,
                 "clips": json.dumps([{
                     "length": video_info["duration"],
                     "source_type": "4",
@@ -1357,7 +2246,7 @@ class InstagramWebAPI:
             )
 
             if r.status_code == 200:
-                result = r.json()
+                result = _parse_json(r)
                 if result.get("status") == "ok":
                     media = result.get("media", {})
                     code = media.get("code", "")
@@ -1373,65 +2262,78 @@ class InstagramWebAPI:
             logger.error(f"Erro no upload de Reel: {e}")
             return None
 
+    # ============================================
+    # UPLOAD: LOTE
+    # ============================================
+
+    def batch_upload(self, items: List[Tuple[str, str, str]],
+                     concurrency: int = 3) -> List[Optional[dict]]:
+        """
+        Vários uploads em paralelo. items: (tipo, caminho, legenda), com tipo
+        em UPLOAD_KINDS. No máximo `concurrency` uploads e FFMPEG_SLOTS
+        processos ffmpeg ao mesmo tempo. Resultados na ordem de items.
+        """
+        def run(item: Tuple[str, str, str]) -> Optional[dict]:
+            kind, path, caption = item
+            method = self.UPLOAD_KINDS.get(kind)
+            if method is None:
+                logger.error(f"Tipo de upload desconhecido: {kind}")
+                return None
+            return getattr(self, method)(path, caption)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(run, items))
+
+        ok = sum(1 for r in results if r)
+        logger.info(f"📦 Lote de uploads: {ok}/{len(items)} publicados")
+        return results
+
     # ============================================
     # UTILITÁRIOS
     # ============================================
 
     def media_pk_from_url(self, url: str) -> Optional[str]:
         """Extrai media ID de uma URL do Instagram"""
-        # Extrair shortcode da URL
-        patterns = [
-            r"instagram\.com/p/([A-Za-z0-9_-]+)",
-            r"instagram\.com/reel/([A-Za-z0-9_-]+)",
-            r"instagram\.com/tv/([A-Za-z0-9_-]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                shortcode = match.group(1)
-                # Buscar media info pelo shortcode
-                return self._shortcode_to_media_id(shortcode)
-        return None
+        # Extrair shortcode da URL e buscar media info por ele
+        match = self._MEDIA_URL_RE.search(url)
+        return self._shortcode_to_media_id(match.group(1)) if match else None
 
     def _shortcode_to_media_id(self, shortcode: str) -> Optional[str]:
-        """Converte shortcode para media ID"""
+        """Converte shortcode para media ID (memoizado: o ID nunca muda).
+        Rate limit (HTTPError 429) sobe para o chamador aplicar o backoff."""
         try:
-            r = self.session.get(
-                f"{self.GRAPHQL_URL}/",
-                params={
-                    "query_hash": "b3055c01b4b222b8a47dc12b090e4e64",
-                    "variables": json.dumps({
-                        "shortcode": shortcode,
-                    }),
-                },
-                timeout=15,
-            )
-            if r.status_code == 200:
-                data = r.json()
-                media = data.get("data", {}).get("shortcode_media", {})
-                return media.get("id")
+            return self._media_id_cached(shortcode)
+        except LookupError:
+            return None
+        except requests.exceptions.HTTPError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao converter shortcode {shortcode}: {e}")
-        return None
+            return None
+
+    def _fetch_media_id(self, shortcode: str) -> str:
+        # Falhas levantam exceção para não ficarem no cache do lru_cache
+        r = self._graphql_get(_gql_params(self.Q_SHORTCODE_MEDIA, {
+            "shortcode": shortcode,
+        }))
+        if r.status_code == 200:
+            media_id = _parse_json(r).get("data", {}).get("shortcode_media", {}).get("id")
+            if media_id:
+                return media_id
+        raise LookupError(shortcode)
 
     def search_users(self, query: str, amount: int = 10) -> List[WebUser]:
         """Busca usuários por nome"""
-        users = []
         try:
             data = self._api_get(
                 "web/search/topsearch/",
                 params={"query": query, "context": "blended"},
             )
-            for item in data.get("users", [])[:amount]:
-                u = item.get("user", {})
-                users.append(WebUser(
-                    pk=u.get("pk", 0),
-                    username=u.get("username", ""),
-                    full_name=u.get("full_name", ""),
-                    is_private=u.get("is_private", False),
-                    is_verified=u.get("is_verified", False),
-                    profile_pic_url=u.get("profile_pic_url", ""),
-                ))
+            return [
+                WebUser.from_api_dict(u)
+                for item in data.get("users", [])[:amount]
+                if (u := item.get("user"))
+            ]
         except Exception as e:
             logger.error(f"Erro na busca: {e}")
-        return users
+            return []
@@ -5,66 +5,32 @@ Automação Inteligente de Crescimento
 """
 import os
 import sys
+import re
 import signal
 import time
-import json
-import threading
+import traceback
+from datetime import datetime
+
+from dotenv import load_dotenv
 
 # Adiciona src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from utils import (
     print_banner, print_menu, print_success, 
-    print_error, print_info, print_warning
+    print_error, print_info, print_warning, format_json
 )
-from bot import InstagramBot
 from config import config
 
-# Variável global para o bot
-bot = None
+# Separador das listas digitadas (vírgulas e/ou espaços)
+_LIST_SEP_RE = re.compile(r"[,\s]+")
 
-def signal_handler(sig, frame):
-    """Handler de interrupção"""
-    print("\n")
-    print_warning("Interrupção detectada!")
-    
-    if bot:
-        print_info("Encerrando bot graciosamente...")
-        try:
-            if bot.content_scheduler.is_daemon_running():
-                bot.content_scheduler.stop_daemon()
-            bot.quit()
-        except:
-            pass
-    
-    print_success("Até logo! 👋")
-    sys.exit(0)
+def _split_list(text: str) -> list:
+    """Divide a entrada em itens não vazios numa única passada"""
+    return list(filter(None, _LIST_SEP_RE.split(text)))
 
-def check_requirements():
-    """Verifica requisitos"""
-    # Verifica .env
-    if not os.path.exists('.env'):
-        print_error("Arquivo .env não encontrado!")
-        print_info("Copie .env.example para .env e configure suas credenciais")
-        return False
-    
-    # Verifica credenciais
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    if not os.getenv('IG_USERNAME') or not os.getenv('IG_PASSWORD'):
-        print_error("Credenciais não configuradas!")
-        print_info("Edite o arquivo .env e adicione:")
-        print("  IG_USERNAME=seu_usuario")
-        print("  IG_PASSWORD=sua_senha")
-        return False
-    
-    return True
-
-def menu_crescimento():
-    """Menu de crescimento"""
-    while True:
-        print("""
+# Banners dos menus (montados uma vez)
+_MENU_CRESCIMENTO = """
 ╔══════════════════════════════════════════════════════════╗
 ║  👥 MENU DE CRESCIMENTO                                  ║
 ╠══════════════════════════════════════════════════════════╣
@@ -78,54 +44,9 @@ def menu_crescimento():
 ║  [8] ❤️  Curtir por Hashtag                             ║
 ║  [0] ↩️  Voltar                                         ║
 ╚══════════════════════════════════════════════════════════╝
-        """)
-        
-        choice = input("Escolha: ").strip()
-        
-        if choice == "1":
-            bot.run_growth_session("balanced")
-        elif choice == "2":
-            confirm = input("⚠️  Agressivo tem maior risco de bloqueio. Continuar? (s/n): ")
-            if confirm.lower() == 's':
-                bot.run_growth_session("aggressive")
-        elif choice == "3":
-            bot.run_growth_session("safe")
-        elif choice == "4":
-            url = input("URL do post do influenciador: ").strip()
-            qty = int(input("Quantidade de follows (máx 30): ") or "15")
-            bot.growth_engine.follow_recent_likers(url, qty)
-        elif choice == "5":
-            qty = int(input("Máximo de unfollows: ") or "30")
-            bot.followers_manager.clean_non_followers(qty)
-        elif choice == "6":
-            tags_input = input("Hashtags (separadas por vírgula): ").strip()
-            if not tags_input:
-                print_error("Nenhuma hashtag informada!")
-                continue
-            tags = [t.strip() for t in tags_input.split(",") if t.strip()]
-            qty = int(input("Quantidade de stories: ") or "50")
-            bot.growth_engine.mass_story_engagement(tags, qty)
-        elif choice == "7":
-            urls_input = input("URLs dos posts (separadas por vírgula): ").strip()
-            if not urls_input:
-                print_error("Nenhuma URL informada!")
-                continue
-            urls = [u.strip() for u in urls_input.split(",") if u.strip()]
-            qty = int(input("Quantidade de comentários: ") or "5")
-            bot.growth_engine.strategic_commenting(urls, qty)
-        elif choice == "8":
-            tag = input("Hashtag: ").strip()
-            qty = int(input("Quantidade de curtidas: ") or "20")
-            bot.growth_engine.like_by_hashtag(tag, qty)
-        elif choice == "0":
-            break
-        
-        input("\nPressione Enter para continuar...")
+        """
 
-def menu_conteudo():
-    """Menu de conteúdo"""
-    while True:
-        print("""
+_MENU_CONTEUDO = """
 ╔══════════════════════════════════════════════════════════╗
 ║  📤 MENU DE CONTEÚDO                                     ║
 ╠══════════════════════════════════════════════════════════╣
@@ -146,130 +67,9 @@ def menu_conteudo():
 ║  [12] ⏹️  Parar Auto-Publicação                         ║
 ║  [0] ↩️  Voltar                                         ║
 ╚══════════════════════════════════════════════════════════╝
-        """)
-        
-        choice = input("Escolha: ").strip()
-        
-        # === UPLOAD DIRETO ===
-        if choice == "1":
-            path = input("Caminho da foto (.jpg/.png): ").strip()
-            if not os.path.isfile(path):
-                print_error(f"Arquivo não encontrado: {path}")
-                input("\nPressione Enter para continuar...")
-                continue
-            caption = input("Legenda: ").strip()
-            if bot.upload_photo(path, caption):
-                print_success("✅ Foto publicada no feed!")
-            else:
-                print_error("Falha ao publicar foto")
-        
-        elif choice == "2":
-            path = input("Caminho do vídeo (.mp4/.mov): ").strip()
-            if not os.path.isfile(path):
-                print_error(f"Arquivo não encontrado: {path}")
-                input("\nPressione Enter para continuar...")
-                continue
-            caption = input("Legenda: ").strip()
-            if bot.upload_video(path, caption):
-                print_success("✅ Vídeo publicado no feed!")
-            else:
-                print_error("Falha ao publicar vídeo")
-        
-        elif choice == "3":
-            path = input("Caminho da foto (.jpg/.png): ").strip()
-            if not os.path.isfile(path):
-                print_error(f"Arquivo não encontrado: {path}")
-                input("\nPressione Enter para continuar...")
-                continue
-            if bot.upload_story_photo(path):
-                print_success("✅ Story de foto publicado!")
-            else:
-                print_error("Falha ao publicar story")
-        
-        elif choice == "4":
-            path = input("Caminho do vídeo (.mp4/.mov): ").strip()
-            if not os.path.isfile(path):
-                print_error(f"Arquivo não encontrado: {path}")
-                input("\nPressione Enter para continuar...")
-                continue
-            if bot.upload_story_video(path):
-                print_success("✅ Story de vídeo publicado!")
-            else:
-                print_error("Falha ao publicar story de vídeo")
-        
-        elif choice == "5":
-            path = input("Caminho do vídeo (.mp4/.mov): ").strip()
-            if not os.path.isfile(path):
-                print_error(f"Arquivo não encontrado: {path}")
-                input("\nPressione Enter para continuar...")
-                continue
-            caption = input("Legenda do Reel: ").strip()
-            if bot.upload_reel(path, caption):
-                print_success("✅ Reel publicado!")
-            else:
-                print_error("Falha ao publicar Reel")
-        
-        # === AGENDAMENTO ===
-        elif choice == "6":
-            folder = input(f"Pasta de imagens [{config.CONTENT_FOLDER}]: ").strip()
-            folder = folder or config.CONTENT_FOLDER
-            ppd = int(input("Posts por dia [2]: ") or "2")
-            bot.schedule_week_content(folder)
-        elif choice == "7":
-            print("Tipo de conteúdo:")
-            print("  [1] Foto no Feed")
-            print("  [2] Vídeo no Feed")
-            print("  [3] Story")
-            print("  [4] Reel")
-            tipo_choice = input("Escolha o tipo [1]: ").strip() or "1"
-            tipo_map = {"1": "photo", "2": "video", "3": "story", "4": "reel"}
-            content_type = tipo_map.get(tipo_choice, "photo")
-            
-            path = input("Caminho do arquivo: ").strip()
-            caption = input("Legenda (deixe em branco para automático): ").strip()
-            when = input("Quando? (YYYY-MM-DD HH:MM): ").strip()
-            if when:
-                from datetime import datetime
-                dt = datetime.strptime(when, "%Y-%m-%d %H:%M")
-            else:
-                dt = None
-            bot.content_scheduler.schedule_post(path, caption or "", [], dt, content_type)
-        elif choice == "8":
-            posts = bot.content_scheduler.list_scheduled()
-            if posts:
-                print(f"\n{'ID':<20} {'Data':<20} {'Tipo':<10}")
-                print("-" * 50)
-                for p in posts:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(p.scheduled_time)
-                    print(f"{p.id:<20} {dt.strftime('%d/%m %H:%M'):<20} {p.content_type:<10}")
-            else:
-                print_info("Nenhum post agendado")
-        elif choice == "9":
-            post_id = input("ID do post: ").strip()
-            bot.content_scheduler.cancel_post(post_id)
-        elif choice == "10":
-            bot.content_scheduler.check_and_post()
-        elif choice == "11":
-            print_info("Iniciando daemon em thread separada...")
-            daemon_thread = threading.Thread(
-                target=bot.content_scheduler.run_scheduler_daemon,
-                daemon=True
-            )
-            daemon_thread.start()
-            print_success("Daemon iniciado! O sistema publicará automaticamente.")
-        elif choice == "12":
-            bot.content_scheduler.stop_daemon()
-            print_success("Daemon parado!")
-        elif choice == "0":
-            break
-        
-        input("\nPressione Enter para continuar...")
+        """
 
-def menu_analytics():
-    """Menu de analytics"""
-    while True:
-        print("""
+_MENU_ANALYTICS = """
 ╔══════════════════════════════════════════════════════════╗
 ║  📊 MENU DE ANALYTICS                                    ║
 ╠══════════════════════════════════════════════════════════╣
@@ -280,36 +80,9 @@ def menu_analytics():
 ║  [5] 📊 Estatísticas do Sistema                          ║
 ║  [0] ↩️  Voltar                                          ║
 ╚══════════════════════════════════════════════════════════╝
-        """)
-        
-        choice = input("Escolha: ").strip()
-        
-        if choice == "1":
-            bot.analytics_engine.analyze_follower_activity()
-            bot.analytics_engine.calculate_best_posting_times()
-        elif choice == "2":
-            qty = int(input("Quantos posts analisar [9]: ") or "9")
-            bot.analytics_engine.analyze_post_performance(qty)
-        elif choice == "3":
-            print(bot.analytics_engine.generate_report())
-        elif choice == "4":
-            times = bot.analytics_engine.export_best_times()
-            print_info("Melhores horários:")
-            for k, v in times.items():
-                print(f"  {k}: {v}")
-        elif choice == "5":
-            stats = bot.get_stats()
-            print("\n📊 Estatísticas do Sistema:")
-            print(json.dumps(stats, indent=2, ensure_ascii=False, default=str))
-        elif choice == "0":
-            break
-        
-        input("\nPressione Enter para continuar...")
+        """
 
-def menu_configuracoes():
-    """Menu de configurações"""
-    while True:
-        print("""
+_MENU_CONFIGURACOES = """
 ╔══════════════════════════════════════════════════════════╗
 ║  ⚙️  MENU DE CONFIGURAÇÕES                               ║
 ╠══════════════════════════════════════════════════════════╣
@@ -321,45 +94,312 @@ def menu_configuracoes():
 ║  [6] 📊 Ver Estatísticas de Seguidores                   ║
 ║  [0] ↩️  Voltar                                          ║
 ╚══════════════════════════════════════════════════════════╝
-        """)
+        """
+
+_AGENDA_HEADER = f"\n{'ID':<20} {'Data':<20} {'Tipo':<10}\n" + "-" * 50
+
+def prompt_int(msg: str, default: int, lo: int = 1, hi: int = None) -> int:
+    """Lê um inteiro (Enter = default), repetindo até ser válido; limita a `hi`"""
+    while True:
+        raw = input(msg).strip()
+        try:
+            value = int(raw) if raw else default
+        except ValueError:
+            print_error(f"Número inválido: {raw}")
+            continue
+        if value < lo:
+            print_error(f"Valor mínimo: {lo}")
+            continue
+        if hi is not None and value > hi:
+            print_warning(f"Limitado a {hi}")
+            value = hi
+        return value
+
+def pause():
+    """Espera Enter antes de redesenhar o menu. O daemon de publicação roda
+    em thread própria, então nada fica parado enquanto o input bloqueia"""
+    input("\nPressione Enter para continuar...")
+
+def signal_handler(sig, frame):
+    """Handler de interrupção: só interrompe o fluxo atual; o encerramento
+    roda uma única vez no finally de main(), fora do frame do sinal"""
+    raise KeyboardInterrupt
+
+def check_requirements():
+    """Verifica requisitos"""
+    # Verifica .env
+    if not os.path.isfile('.env'):
+        print_error("Arquivo .env não encontrado!")
+        print_info("Copie .env.example para .env e configure suas credenciais")
+        return False
+    
+    # Verifica credenciais (config.py já carrega o .env ao ser importado)
+    username, password = os.getenv('IG_USERNAME'), os.getenv('IG_PASSWORD')
+    if not (username and password):
+        load_dotenv()
+        username, password = os.getenv('IG_USERNAME'), os.getenv('IG_PASSWORD')
+    
+    if not username or not password:
+        print_error("Credenciais não configuradas!")
+        print_info("Edite o arquivo .env e adicione:")
+        print("  IG_USERNAME=seu_usuario")
+        print("  IG_PASSWORD=sua_senha")
+        return False
+    
+    return True
+
+def menu_crescimento(bot):
+    """Menu de crescimento"""
+    while True:
+        print(_MENU_CRESCIMENTO)
         
         choice = input("Escolha: ").strip()
         
-        if choice == "1":
-            user = input("Username do influenciador: ").strip()
-            niche = input("Nicho: ").strip()
-            bot.growth_engine.add_target_influencer(user, niche)
-        elif choice == "2":
-            user = input("Username do concorrente: ").strip()
-            bot.growth_engine.targets["concorrentes"].append(user)
-            bot.growth_engine.save_targets()
-            print_success(f"Concorrente @{user} adicionado")
-        elif choice == "3":
-            user = input("Username para proteger: ").strip()
-            bot.followers_manager.add_to_whitelist(user)
-        elif choice == "4":
-            print(f"\n🛡️  Whitelist ({len(bot.followers_manager.whitelist)} usuários):")
-            for user in sorted(bot.followers_manager.whitelist):
-                print(f"  • @{user}")
-        elif choice == "5":
-            user = input("Username para remover: ").strip()
-            bot.followers_manager.remove_from_whitelist(user)
-        elif choice == "6":
-            stats = bot.followers_manager.get_stats()
-            print("\n📊 Estatísticas de Seguidores:")
-            for k, v in stats.items():
-                print(f"  {k}: {v}")
-        elif choice == "0":
-            break
+        match choice:
+            case "1":
+                bot.run_growth_session("balanced")
+            case "2":
+                confirm = input("⚠️  Agressivo tem maior risco de bloqueio. Continuar? (s/n): ")
+                if confirm.lower() == 's':
+                    bot.run_growth_session("aggressive")
+            case "3":
+                bot.run_growth_session("safe")
+            case "4":
+                url = input("URL do post do influenciador: ").strip()
+                qty = prompt_int("Quantidade de follows (máx 30): ", 15, hi=30)
+                bot.growth_engine.follow_recent_likers(url, qty)
+            case "5":
+                qty = prompt_int("Máximo de unfollows: ", 30)
+                bot.followers_manager.clean_non_followers(qty)
+            case "6":
+                tags_input = input("Hashtags (separadas por vírgula): ").strip()
+                if not tags_input:
+                    print_error("Nenhuma hashtag informada!")
+                    continue
+                tags = _split_list(tags_input)
+                qty = prompt_int("Quantidade de stories: ", 50)
+                bot.growth_engine.mass_story_engagement(tags, qty)
+            case "7":
+                urls_input = input("URLs dos posts (separadas por vírgula): ").strip()
+                if not urls_input:
+                    print_error("Nenhuma URL informada!")
+                    continue
+                urls = _split_list(urls_input)
+                qty = prompt_int("Quantidade de comentários: ", 5)
+                bot.growth_engine.strategic_commenting(urls, qty)
+            case "8":
+                tag = input("Hashtag: ").strip()
+                qty = prompt_int("Quantidade de curtidas: ", 20)
+                bot.growth_engine.like_by_hashtag(tag, qty)
+            case "0":
+                break
         
-        input("\nPressione Enter para continuar...")
+        pause()
+
+def menu_conteudo(bot):
+    """Menu de conteúdo"""
+    while True:
+        print(_MENU_CONTEUDO)
+        
+        choice = input("Escolha: ").strip()
+        
+        match choice:
+            # === UPLOAD DIRETO ===
+            case "1":
+                path = input("Caminho da foto (.jpg/.png): ").strip()
+                media = bot.content_scheduler.resolve_media(path)
+                if not media:
+                    print_error(f"Arquivo não encontrado: {path}")
+                    pause()
+                    continue
+                caption = input("Legenda: ").strip()
+                if bot.upload_photo(media, caption):
+                    print_success("✅ Foto publicada no feed!")
+                else:
+                    print_error("Falha ao publicar foto")
+        
+            case "2":
+                path = input("Caminho do vídeo (.mp4/.mov): ").strip()
+                media = bot.content_scheduler.resolve_media(path)
+                if not media:
+                    print_error(f"Arquivo não encontrado: {path}")
+                    pause()
+                    continue
+                caption = input("Legenda: ").strip()
+                if bot.upload_video(media, caption):
+                    print_success("✅ Vídeo publicado no feed!")
+                else:
+                    print_error("Falha ao publicar vídeo")
+        
+            case "3":
+                path = input("Caminho da foto (.jpg/.png): ").strip()
+                media = bot.content_scheduler.resolve_media(path)
+                if not media:
+                    print_error(f"Arquivo não encontrado: {path}")
+                    pause()
+                    continue
+                if bot.upload_story_photo(media):
+                    print_success("✅ Story de foto publicado!")
+                else:
+                    print_error("Falha ao publicar story")
+        
+            case "4":
+                path = input("Caminho do vídeo (.mp4/.mov): ").strip()
+                media = bot.content_scheduler.resolve_media(path)
+                if not media:
+                    print_error(f"Arquivo não encontrado: {path}")
+                    pause()
+                    continue
+                if bot.upload_story_video(media):
+                    print_success("✅ Story de vídeo publicado!")
+                else:
+                    print_error("Falha ao publicar story de vídeo")
+        
+            case "5":
+                path = input("Caminho do vídeo (.mp4/.mov): ").strip()
+                media = bot.content_scheduler.resolve_media(path)
+                if not media:
+                    print_error(f"Arquivo não encontrado: {path}")
+                    pause()
+                    continue
+                caption = input("Legenda do Reel: ").strip()
+                if bot.upload_reel(media, caption):
+                    print_success("✅ Reel publicado!")
+                else:
+                    print_error("Falha ao publicar Reel")
+        
+            # === AGENDAMENTO ===
+            case "6":
+                folder = input(f"Pasta de imagens [{config.CONTENT_FOLDER}]: ").strip()
+                folder = folder or config.CONTENT_FOLDER
+                ppd = prompt_int(f"Posts por dia [{config.POSTS_PER_DAY}]: ", config.POSTS_PER_DAY)
+                bot.schedule_week_content(folder, ppd)
+            case "7":
+                print("Tipo de conteúdo:")
+                print("  [1] Foto no Feed")
+                print("  [2] Vídeo no Feed")
+                print("  [3] Story")
+                print("  [4] Reel")
+                tipo_choice = input("Escolha o tipo [1]: ").strip() or "1"
+                tipo_map = {"1": "photo", "2": "video", "3": "story", "4": "reel"}
+                content_type = tipo_map.get(tipo_choice, "photo")
+            
+                path = input("Caminho do arquivo: ").strip()
+                path = bot.content_scheduler.resolve_media(path) or path
+                caption = input("Legenda (deixe em branco para automático): ").strip()
+                when = input("Quando? (YYYY-MM-DD HH:MM): ").strip()
+                if when:
+                    dt = datetime.strptime(when, "%Y-%m-%d %H:%M")
+                else:
+                    dt = None
+                bot.content_scheduler.schedule_post(path, caption or "", [], dt, content_type)
+            case "8":
+                posts = bot.content_scheduler.list_scheduled()
+                if posts:
+                    # Tabela montada inteira e escrita de uma vez
+                    lines = [_AGENDA_HEADER]
+                    lines.extend(
+                        f"{p.id:<20} {datetime.fromisoformat(p.scheduled_time).strftime('%d/%m %H:%M'):<20} "
+                        f"{p.content_type:<10}"
+                        for p in posts
+                    )
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    sys.stdout.flush()
+                else:
+                    print_info("Nenhum post agendado")
+            case "9":
+                post_id = input("ID do post: ").strip()
+                bot.content_scheduler.cancel_post(post_id)
+            case "10":
+                bot.content_scheduler.check_and_post()
+            case "11":
+                print_info("Iniciando daemon em thread separada...")
+                if bot.content_scheduler.start_daemon():
+                    print_success("Daemon iniciado! O sistema publicará automaticamente.")
+                else:
+                    print_warning("Daemon já está em execução")
+            case "12":
+                if bot.content_scheduler.stop_daemon(timeout=5):
+                    print_success("Daemon parado!")
+                else:
+                    print_warning("Daemon encerrará ao fim da publicação em andamento")
+            case "0":
+                break
+        
+        pause()
+
+def menu_analytics(bot):
+    """Menu de analytics"""
+    while True:
+        print(_MENU_ANALYTICS)
+        
+        choice = input("Escolha: ").strip()
+        
+        match choice:
+            case "1":
+                bot.analytics_engine.analyze_follower_activity()
+                bot.analytics_engine.calculate_best_posting_times()
+            case "2":
+                qty = prompt_int("Quantos posts analisar [9]: ", 9)
+                bot.analytics_engine.analyze_post_performance(qty)
+            case "3":
+                print(bot.analytics_engine.generate_report())
+            case "4":
+                times = bot.analytics_engine.export_best_times()
+                print_info("Melhores horários:")
+                for k, v in times.items():
+                    print(f"  {k}: {v}")
+            case "5":
+                stats = bot.get_stats()
+                print("\n📊 Estatísticas do Sistema:")
+                print(format_json(stats))
+            case "0":
+                break
+        
+        pause()
+
+def menu_configuracoes(bot):
+    """Menu de configurações"""
+    while True:
+        print(_MENU_CONFIGURACOES)
+        
+        choice = input("Escolha: ").strip()
+        
+        match choice:
+            case "1":
+                user = input("Username do influenciador: ").strip()
+                niche = input("Nicho: ").strip()
+                bot.growth_engine.add_target_influencer(user, niche)
+            case "2":
+                user = input("Username do concorrente: ").strip()
+                bot.growth_engine.add_target_competitor(user)
+            case "3":
+                user = input("Username para proteger: ").strip()
+                bot.followers_manager.add_to_whitelist(user)
+            case "4":
+                print(f"\n🛡️  Whitelist ({len(bot.followers_manager.whitelist)} usuários):")
+                for user in bot.followers_manager.sorted_whitelist():
+                    print(f"  • @{user}")
+            case "5":
+                user = input("Username para remover: ").strip()
+                bot.followers_manager.remove_from_whitelist(user)
+            case "6":
+                stats = bot.followers_manager.get_stats()
+                print("\n📊 Estatísticas de Seguidores:")
+                for k, v in stats.items():
+                    print(f"  {k}: {v}")
+            case "0":
+                break
+        
+        pause()
 
 def main():
     """Função principal"""
-    global bot
+    bot = None
     
     # Registra handler de sinal
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     
     # Banner
     print_banner()
@@ -368,11 +408,12 @@ def main():
     if not check_requirements():
         sys.exit(1)
     
-    # Inicializa bot
-    print_info("Inicializando Instagram Growth Suite...")
-    bot = InstagramBot()
-    
     try:
+        # Inicializa bot (importado só aqui: o cliente HTTP não carrega se os requisitos falharem)
+        print_info("Inicializando Instagram Growth Suite...")
+        from bot import InstagramBot
+        bot = InstagramBot()
+        
         # Login
         print_info("Realizando login...")
         if not bot.login():
@@ -386,30 +427,38 @@ def main():
             print_menu()
             choice = input("Escolha: ").strip()
             
-            if choice == "1":
-                menu_crescimento()
-            elif choice == "2":
-                menu_configuracoes()
-            elif choice == "3":
-                menu_conteudo()
-            elif choice == "4":
-                menu_analytics()
-            elif choice == "5":
-                bot.analyze_and_report()
-            elif choice == "0":
-                break
-            else:
-                print_error("Opção inválida!")
+            match choice:
+                case "1":
+                    menu_crescimento(bot)
+                case "2":
+                    menu_configuracoes(bot)
+                case "3":
+                    menu_conteudo(bot)
+                case "4":
+                    menu_analytics(bot)
+                case "5":
+                    bot.analyze_and_report()
+                case "0":
+                    break
+                case _:
+                    print_error("Opção inválida!")
     
     except KeyboardInterrupt:
-        signal_handler(None, None)
+        print("\n")
+        print_warning("Interrupção detectada!")
     except Exception as e:
         print_error(f"Erro: {e}")
-        import traceback
         traceback.print_exc()
     finally:
+        # Um segundo Ctrl-C/SIGTERM não pode abortar a gravação de sessão e estatísticas
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
         if bot:
-            bot.quit()
+            print_info("Encerrando bot graciosamente...")
+            try:
+                bot.quit()
+            except Exception as e:
+                print_error(f"Erro ao encerrar: {e}")
         print("\n👋 Até logo!")
 
 if __name__ == "__main__":
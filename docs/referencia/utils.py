@@ -2,6 +2,7 @@
 Utilitários e funções auxiliares
 """
 import os
+import json
 import time
 import random
 import logging
@@ -10,6 +11,11 @@ from datetime import datetime
 from typing import Optional, Callable, Any
 from colorama import Fore, Style, init
 
+try:
+    import orjson  # opcional: serialização bem mais rápida
+except ImportError:
+    orjson = None
+
 # Inicializa colorama
 init(autoreset=True)
 
@@ -138,6 +144,15 @@ class RateLimiter:
         
         return can_do
     
+    def remaining(self, action_type: str, max_per_hour: int) -> int:
+        """Quantas ações ainda cabem na janela da última hora"""
+        hour_ago = datetime.now().timestamp() - 3600
+        self.actions[action_type] = [
+            ts for ts in self.actions[action_type]
+            if ts > hour_ago
+        ]
+        return max(max_per_hour - len(self.actions[action_type]), 0)
+
     def record_action(self, action_type: str):
         """Registra uma ação realizada"""
         self.actions[action_type].append(datetime.now().timestamp())
@@ -220,15 +235,28 @@ def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 def save_json(data: dict, filepath: str):
-    """Salva dados em JSON"""
-    import json
+    """Salva dados em JSON (usa orjson se instalado). Grava em .tmp e troca
+    com os.replace, então o arquivo nunca fica pela metade"""
     ensure_dir(os.path.dirname(filepath))
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp = f"{filepath}.tmp"
+    if orjson is not None:
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, filepath)
+
+def format_json(data) -> str:
+    """JSON indentado para exibição (orjson se instalado; tipos desconhecidos viram str)"""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
 
 def load_json(filepath: str, default: dict = None) -> dict:
     """Carrega dados de JSON"""
-    import json
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)